@@ -6,15 +6,31 @@
 and extensible capabilities.
 """
 
-import os
-
-# Read version from VERSION file
-_version_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "VERSION")
-try:
-    with open(_version_file) as f:
-        __version__ = f.read().strip()
-except (FileNotFoundError, IOError):
-    __version__ = "1.0.0"
+from typing import Any
 
 __author__ = "kura120"
-__license__ = "MIT"
\ No newline at end of file
+__license__ = "MIT"
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve __version__ on first access instead of reading VERSION at import time
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        value = version("sena")
+    except PackageNotFoundError:
+        # Not installed (dev checkout / PyInstaller bundle) — read the VERSION file
+        import os
+
+        version_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), "VERSION")
+        try:
+            with open(version_file) as f:
+                value = f.read().strip()
+        except (FileNotFoundError, IOError):
+            value = "1.0.0"
+
+    globals()["__version__"] = value
+    return value
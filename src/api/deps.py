@@ -1,120 +1,292 @@
 # src/api/deps.py
 """API Dependencies - Dependency injection for FastAPI routes."""
 
+# Heavy modules (Sena, memory, database, telemetry) are imported inside the
+# functions that need them so that importing this module stays cheap. Each
+# dependency is a cached singleton, so after warm-up the deferred import is
+# just a sys.modules lookup.
+
+import asyncio
+import random
 import time
-from typing import AsyncGenerator, Optional
-
-from src.api.websocket.manager import WebSocketManager, ws_manager
-from src.core.constants import ProcessingStage
-from src.core.sena import Sena
-from src.core.telemetry import TelemetryCollector
-from src.core.telemetry import get_telemetry as _get_telemetry
-from src.database.connection import DatabaseManager
-from src.database.connection import get_db as _get_db
-from src.database.repositories.extension_repo import ExtensionRepository
-from src.database.repositories.memory_repo import MemoryRepository
-from src.memory.manager import MemoryManager
+import weakref
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Optional, TypeVar
+
 from src.utils.logger import logger
 
+if TYPE_CHECKING:
+    from src.api.websocket.manager import WebSocketManager
+    from src.core.constants import ProcessingStage
+    from src.core.sena import Sena
+    from src.core.telemetry import TelemetryCollector
+    from src.database.connection import DatabaseManager
+    from src.database.repositories.extension_repo import ExtensionRepository
+    from src.database.repositories.memory_repo import MemoryRepository
+    from src.memory.manager import MemoryManager
+
+
+# Strong references to in-flight stage broadcasts so they aren't garbage
+# collected before they finish.
+_pending_broadcasts: set[asyncio.Task] = set()
+
+# ProcessingStage -> wire string, filled on the first stage callback so the
+# constants module stays out of the import path.
+_STAGE_STR: dict["ProcessingStage", str] = {}
+
+
+def _log_broadcast_error(task: asyncio.Task) -> None:
+    """Done-callback: retrieve and log a failed broadcast so it isn't reported as unhandled."""
+    _pending_broadcasts.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.warning(f"Stage broadcast failed: {type(exc).__name__}: {exc}")
+
+
+async def _ws_stage_callback(stage: "ProcessingStage", details: str = "") -> None:
+    """Bridge Sena processing stages to WebSocket broadcast.
+
+    The broadcast runs as a background task so a slow client never stalls
+    the processing pipeline — stage updates are best-effort telemetry.
+    """
+    from src.api.websocket.manager import ws_manager
+
+    if not _STAGE_STR:
+        from src.core.constants import ProcessingStage
+
+        _STAGE_STR.update({s: s.value for s in ProcessingStage})
 
-async def _ws_stage_callback(stage: ProcessingStage, details: str = "") -> None:
-    """Bridge Sena processing stages to WebSocket broadcast."""
-    stage_str = stage.value if isinstance(stage, ProcessingStage) else str(stage)
-    await ws_manager.broadcast_processing_update(stage_str, details)
+    stage_str = _STAGE_STR.get(stage) or str(stage)
+    task = asyncio.create_task(ws_manager.broadcast_processing_update(stage_str, details))
+    _pending_broadcasts.add(task)
+    task.add_done_callback(_log_broadcast_error)
 
 
 # Global Sena instance
-_sena_instance: Optional[Sena] = None
+_sena_instance: Optional["Sena"] = None
 
-# Cooldown between failed init attempts — prevents rapid-fire re-init loop
-# when Ollama is unavailable (e.g. still starting up).
-_last_init_attempt: float = 0.0
-_INIT_COOLDOWN_SECONDS: float = 15.0
+# Reports a Sena instance that is garbage-collected without shutdown() having
+# completed. Detached on a clean shutdown.
+_sena_finalizer: Optional[weakref.finalize] = None
 
 
-async def get_sena() -> Sena:
+def _log_leak(session_id: str) -> None:
+    logger.warning(f"Sena instance (session {session_id}) was discarded without a clean shutdown")
+
+
+# Jittered exponential backoff between failed init attempts — prevents a
+# rapid-fire re-init loop while Ollama is unavailable (e.g. still starting up)
+# without every client retrying on the same boundary.
+_INIT_BACKOFF_BASE_SECONDS: float = 1.0
+_INIT_BACKOFF_FACTOR: float = 2.0
+_INIT_BACKOFF_CAP_SECONDS: float = 30.0
+_INIT_BACKOFF_JITTER: float = 0.5
+_consecutive_failures: int = 0
+_next_attempt_at: float = 0.0
+
+# Failures that retrying cannot fix (broken install, bad code). Once one of
+# these is hit, get_sena() stops re-initializing until the process restarts.
+_UNRECOVERABLE_INIT_ERRORS: tuple[type[BaseException], ...] = (ImportError, SyntaxError)
+_fatal_init_error: Optional[str] = None
+
+# Serialises first-time initialization so concurrent cold-start requests don't
+# each construct and initialize their own Sena. Created lazily inside a
+# running loop so importing this module never binds to a loop.
+_init_lock: Optional[asyncio.Lock] = None
+
+# Set once Sena has initialized successfully. The hot path only reads this
+# flag; requests that arrive mid-init wait on it instead of queueing on the lock.
+# A fresh event is armed after each failed attempt so waiters are released.
+_ready: Optional[asyncio.Event] = None
+_INIT_WAIT_TIMEOUT_SECONDS: float = 60.0
+
+# Resolved DatabaseManager, cached after first lookup so repository factories
+# skip the extra await chain on every request.
+_db_cached: Optional["DatabaseManager"] = None
+_db_init_lock: Optional[asyncio.Lock] = None
+
+
+async def get_sena() -> "Sena":
     """
     Get the global Sena instance.
 
     On success: returns the initialized instance (cached).
-    On failure: resets the instance, records the attempt timestamp,
-    and raises. Subsequent callers within the cooldown window receive
-    an immediate error instead of triggering a full re-init cycle —
-    this prevents log-spam loops when Ollama is not yet ready.
+    On failure: resets the instance, schedules the next allowed attempt
+    with jittered exponential backoff, and raises. Subsequent callers
+    inside the backoff window receive an immediate error instead of
+    triggering a full re-init cycle — this prevents log-spam loops when
+    Ollama is not yet ready. Unrecoverable errors disable retries entirely.
     """
-    global _sena_instance, _last_init_attempt
+    global _sena_instance, _sena_finalizer, _init_lock, _ready, _consecutive_failures, _next_attempt_at
+    global _fatal_init_error
 
     # Fast path — already initialized
-    if _sena_instance is not None and _sena_instance.is_initialized:
+    if _ready is not None and _ready.is_set():
+        assert _sena_instance is not None  # _ready is only set after a successful init
         return _sena_instance
 
-    # Cooldown guard — don't hammer re-init while Ollama is starting
-    now = time.monotonic()
-    if _sena_instance is None and (now - _last_init_attempt) < _INIT_COOLDOWN_SECONDS:
-        remaining = _INIT_COOLDOWN_SECONDS - (now - _last_init_attempt)
-        raise RuntimeError(
-            f"Sena initialization is in cooldown ({remaining:.0f}s remaining). "
-            "Previous attempt failed — waiting for Ollama to become ready."
-        )
-
-    _last_init_attempt = now
-    logger.info("Initializing Sena instance for API...")
-    _sena_instance = None  # clean slate so a partial object is never reused
-    try:
-        _sena_instance = Sena()
-        await _sena_instance.initialize()
-        _sena_instance.set_stage_callback(_ws_stage_callback)
-        logger.info("Sena stage callback wired to WebSocket manager.")
-        logger.info(f"Sena instance initialized successfully. Is initialized: {_sena_instance.is_initialized}")
-        # Reset cooldown timer on success so a future restart gets a clean slate
-        _last_init_attempt = 0.0
-    except Exception as e:
-        _sena_instance = None  # reset so the next attempt (after cooldown) can retry
-        logger.error(f"Failed to initialize Sena instance: {type(e).__name__}: {e}", exc_info=True)
-        raise
-
-    return _sena_instance
-
-
-async def get_memory_manager() -> MemoryManager:
+    if _ready is None:
+        _ready = asyncio.Event()
+    if _init_lock is None:
+        _init_lock = asyncio.Lock()
+
+    # Another request is initializing — wait for its outcome rather than
+    # queueing up behind it on the lock.
+    if _init_lock.locked():
+        attempt = _ready
+        try:
+            await asyncio.wait_for(attempt.wait(), timeout=_INIT_WAIT_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Timed out waiting for Sena initialization to complete.") from None
+        if _ready.is_set():
+            assert _sena_instance is not None
+            return _sena_instance
+        raise RuntimeError("Sena initialization failed — see server logs for details.")
+
+    async with _init_lock:
+        # Re-check — another request may have finished init while we waited
+        if _ready.is_set():
+            assert _sena_instance is not None
+            return _sena_instance
+
+        if _fatal_init_error is not None:
+            raise RuntimeError(f"Sena initialization failed permanently ({_fatal_init_error}). Restart required.")
+
+        # Backoff guard — don't hammer re-init while Ollama is starting
+        now = time.monotonic()
+        if now < _next_attempt_at:
+            remaining = _next_attempt_at - now
+            raise RuntimeError(
+                f"Sena initialization is in cooldown ({remaining:.0f}s remaining). "
+                "Previous attempt failed — waiting for Ollama to become ready."
+            )
+
+        from src.core.sena import Sena
+
+        logger.info("Initializing Sena instance for API...")
+        _sena_instance = None  # clean slate so a partial object is never reused
+        try:
+            _sena_instance = Sena()
+            await _sena_instance.initialize()
+            _sena_instance.set_stage_callback(_ws_stage_callback)
+            _sena_finalizer = weakref.finalize(_sena_instance, _log_leak, _sena_instance.session_id)
+            logger.info("Sena stage callback wired to WebSocket manager.")
+            logger.info(f"Sena instance initialized successfully. Is initialized: {_sena_instance.is_initialized}")
+            # Reset backoff on success so a future restart gets a clean slate
+            _consecutive_failures = 0
+            _next_attempt_at = 0.0
+            _ready.set()
+        except Exception as e:
+            _sena_instance = None  # reset so the next attempt (after backoff) can retry
+            logger.error(f"Failed to initialize Sena instance: {type(e).__name__}: {e}", exc_info=True)
+            if isinstance(e, _UNRECOVERABLE_INIT_ERRORS):
+                _fatal_init_error = f"{type(e).__name__}: {e}"
+            else:
+                delay = min(
+                    _INIT_BACKOFF_CAP_SECONDS,
+                    _INIT_BACKOFF_BASE_SECONDS * (_INIT_BACKOFF_FACTOR**_consecutive_failures),
+                )
+                delay *= 1 + random.uniform(-_INIT_BACKOFF_JITTER, _INIT_BACKOFF_JITTER)
+                _consecutive_failures += 1
+                _next_attempt_at = time.monotonic() + delay
+            # Release anyone waiting on this attempt, then arm a fresh event for the next one
+            failed, _ready = _ready, asyncio.Event()
+            failed.set()
+            raise
+
+        return _sena_instance
+
+
+async def get_memory_manager() -> "MemoryManager":
     """Get the canonical MemoryManager instance, initializing it if needed."""
+    from src.memory.manager import MemoryManager
+
     mgr = MemoryManager.get_instance()
-    if not mgr.initialized:
-        await mgr.initialize()
+    await mgr.initialize()  # idempotent; serialized by the manager's own lock
     return mgr
 
 
-async def get_db() -> DatabaseManager:
+async def get_db() -> "DatabaseManager":
     """Get the database manager."""
-    return await _get_db()
+    global _db_cached, _db_init_lock
+
+    if _db_cached is not None:
+        return _db_cached
+
+    from src.database.connection import get_db as _get_db
+
+    if _db_init_lock is None:
+        _db_init_lock = asyncio.Lock()
+
+    async with _db_init_lock:
+        if _db_cached is None:
+            _db_cached = await _get_db()
+    return _db_cached
 
 
-async def get_memory_repo() -> MemoryRepository:
+_R = TypeVar("_R")
+
+# One repository per (class, database) pair — repositories are stateless wrappers.
+# Cleared on shutdown along with the cached DatabaseManager.
+_repo_cache: dict[tuple[Callable[..., Any], "DatabaseManager"], Any] = {}
+
+
+def _make_repo(repo_class: Callable[["DatabaseManager"], _R], db: "DatabaseManager") -> _R:
+    """Return the cached repository of *repo_class* for *db*, building it on first use."""
+    repo: Optional[_R] = _repo_cache.get((repo_class, db))
+    if repo is None:
+        repo = repo_class(db)
+        _repo_cache[(repo_class, db)] = repo
+    return repo
+
+
+async def get_memory_repo() -> "MemoryRepository":
     """Get the memory repository."""
-    db = await get_db()
-    return MemoryRepository(db)
+    from src.database.repositories.memory_repo import MemoryRepository
+
+    return _make_repo(MemoryRepository, _db_cached or await get_db())
 
 
-async def get_extension_repo() -> ExtensionRepository:
+async def get_extension_repo() -> "ExtensionRepository":
     """Get the extension repository."""
-    db = await get_db()
-    return ExtensionRepository(db)
+    from src.database.repositories.extension_repo import ExtensionRepository
 
+    return _make_repo(ExtensionRepository, _db_cached or await get_db())
 
-async def get_telemetry() -> TelemetryCollector:
+
+async def get_telemetry() -> "TelemetryCollector":
     """Get the telemetry collector."""
+    from src.core.telemetry import get_telemetry as _get_telemetry
+
     return await _get_telemetry()
 
 
-def get_ws_manager() -> WebSocketManager:
+def get_ws_manager() -> "WebSocketManager":
     """Get the WebSocket manager."""
+    from src.api.websocket.manager import ws_manager
+
     return ws_manager
 
 
 async def shutdown_sena() -> None:
-    """Shutdown the global Sena instance."""
-    global _sena_instance
+    """Shutdown the global Sena instance.
 
-    if _sena_instance:
-        await _sena_instance.shutdown()
-        _sena_instance = None
+    The global is cleared before shutdown() runs, so a failing shutdown can
+    never leave get_sena() handing out a half-shut-down instance.
+    """
+    global _sena_instance, _db_cached
+
+    inst = _sena_instance
+    _sena_instance = None
+    if _ready is not None:
+        _ready.clear()
+    try:
+        if inst is not None:
+            await inst.shutdown()
+            if _sena_finalizer is not None:
+                _sena_finalizer.detach()
+    finally:
+        # Sena.shutdown() closes the shared database — drop the stale references
+        _db_cached = None
+        _repo_cache.clear()
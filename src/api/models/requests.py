@@ -1,8 +1,40 @@
 # src/api/models/requests.py
 """API Request Models."""
 
-from typing import Any, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Final, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Schema examples, built once at import and shared by reference on every
+# OpenAPI schema build.
+_CHAT_EXAMPLE: Final[dict[str, Any]] = {
+    "message": "Hello, how are you?",
+    "session_id": "abc123",
+    "stream": False,
+}
+
+_MEMORY_ADD_EXAMPLE: Final[dict[str, Any]] = {
+    "content": "User prefers dark mode interfaces",
+    "category": "preference",
+    "importance": 7,
+}
+
+_MEMORY_EDIT_EXAMPLE: Final[dict[str, Any]] = {
+    "memory_id": "abc-123-def",
+    "content": "Updated memory content",
+    "importance": 8,
+}
+
+_MEMORY_SEARCH_EXAMPLE: Final[dict[str, Any]] = {
+    "query": "user preferences",
+    "limit": 10,
+}
+
+_EXTENSION_GENERATE_EXAMPLE: Final[dict[str, Any]] = {
+    "description": "Create an extension that gets the current weather for a given city",
+    "name": "weather_lookup",
+    "auto_enable": False,
+}
 
 
 class ChatRequest(BaseModel):
@@ -16,14 +48,10 @@ class ChatRequest(BaseModel):
     mode: Optional[str] = Field("normal", description="Processing mode (normal, fast, critical)")
     extract_learnings: bool = Field(False, description="Extract and store learnings from conversation")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "message": "Hello, how are you?",
-                "session_id": "abc123",
-                "stream": False,
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _CHAT_EXAMPLE},
+        extra="ignore",
+    )
 
 
 class MemoryAddRequest(BaseModel):
@@ -31,17 +59,13 @@ class MemoryAddRequest(BaseModel):
     
     content: str = Field(..., min_length=1, max_length=10000, description="Memory content")
     category: Optional[str] = Field(None, description="Memory category")
-    importance: int = Field(5, ge=1, le=10, description="Importance score (1-10)")
+    importance: int = Field(5, ge=1, le=10, strict=True, description="Importance score (1-10)")
     metadata: dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "content": "User prefers dark mode interfaces",
-                "category": "preference",
-                "importance": 7,
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _MEMORY_ADD_EXAMPLE},
+        extra="ignore",
+    )
 
 
 class MemoryEditRequest(BaseModel):
@@ -49,16 +73,12 @@ class MemoryEditRequest(BaseModel):
     
     memory_id: str = Field(..., description="Memory ID to edit")
     content: Optional[str] = Field(None, description="New content")
-    importance: Optional[int] = Field(None, ge=1, le=10, description="New importance score")
+    importance: Optional[int] = Field(None, ge=1, le=10, strict=True, description="New importance score")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "memory_id": "abc-123-def",
-                "content": "Updated memory content",
-                "importance": 8,
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _MEMORY_EDIT_EXAMPLE},
+        extra="ignore",
+    )
 
 
 class MemorySearchRequest(BaseModel):
@@ -67,15 +87,12 @@ class MemorySearchRequest(BaseModel):
     query: str = Field(..., min_length=1, max_length=1000, description="Search query")
     limit: int = Field(10, ge=1, le=100, description="Maximum results to return")
     category: Optional[str] = Field(None, description="Filter by category")
-    min_importance: Optional[int] = Field(None, ge=1, le=10, description="Minimum importance score")
+    min_importance: Optional[int] = Field(None, ge=1, le=10, strict=True, description="Minimum importance score")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "query": "user preferences",
-                "limit": 10,
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _MEMORY_SEARCH_EXAMPLE},
+        extra="ignore",
+    )
 
 
 class ExtensionGenerateRequest(BaseModel):
@@ -85,14 +102,10 @@ class ExtensionGenerateRequest(BaseModel):
     name: Optional[str] = Field(None, description="Optional name for the extension")
     auto_enable: bool = Field(False, description="Whether to enable the extension automatically")
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "description": "Create an extension that gets the current weather for a given city",
-                "name": "weather_lookup",
-                "auto_enable": False,
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _EXTENSION_GENERATE_EXAMPLE},
+        extra="ignore",
+    )
 
 
 class ExtensionToggleRequest(BaseModel):
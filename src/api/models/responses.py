@@ -2,9 +2,57 @@
 """API Response Models."""
 
 from datetime import datetime
-from typing import Any, Optional
-
-from pydantic import BaseModel, Field
+from typing import Any, Final, Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass
+from starlette.responses import JSONResponse
+
+# Schema examples, built once at import and shared by reference on every
+# OpenAPI schema build.
+_ERROR_EXAMPLE: Final[dict[str, Any]] = {
+    "error": "VALIDATION_ERROR",
+    "message": "Invalid input provided",
+    "details": {"field": "message", "issue": "cannot be empty"},
+}
+
+_CHAT_EXAMPLE: Final[dict[str, Any]] = {
+    "response": "Hello! I'm doing well, thank you for asking.",
+    "session_id": "abc123",
+    "metadata": {
+        "model_used": "gemma2:2b",
+        "processing_time_ms": 1234.56,
+        "intent_type": "greeting",
+        "extensions_used": [],
+        "memory_retrieved": 0,
+    },
+}
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (native datetime/numpy encoding in C).
+
+    Used as the app's default response class. Naive datetimes are emitted
+    as-is — they are local times, so OPT_NAIVE_UTC would mislabel them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True if an ``If-None-Match`` header value matches *etag*.
+
+    Uses the weak comparison GET revalidation calls for, so ``W/`` prefixes are
+    ignored; a list of tags or ``*`` is accepted.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
 
 
 class ErrorResponse(BaseModel):
@@ -14,17 +62,21 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Error message")
     details: Optional[dict[str, Any]] = Field(None, description="Additional error details")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "error": "VALIDATION_ERROR",
-                "message": "Invalid input provided",
-                "details": {"field": "message", "issue": "cannot be empty"},
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra={"example": _ERROR_EXAMPLE},
+        extra="ignore",
+    )
 
 
-class ChatMetadata(BaseModel):
+# Item types below are built server-side from trusted values, often many per
+# response — slotted dataclasses avoid a per-instance __dict__.
+@dataclass(
+    slots=True,
+    frozen=True,
+    kw_only=True,
+    config=ConfigDict(from_attributes=True, defer_build=False, protected_namespaces=()),
+)
+class ChatMetadata:
     """Metadata for chat response."""
 
     model_used: str = Field(..., description="Model that generated the response")
@@ -42,23 +94,24 @@ class ChatResponse(BaseModel):
     session_id: str = Field(..., description="Session ID")
     metadata: ChatMetadata = Field(..., description="Response metadata")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "response": "Hello! I'm doing well, thank you for asking.",
-                "session_id": "abc123",
-                "metadata": {
-                    "model_used": "gemma2:2b",
-                    "processing_time_ms": 1234.56,
-                    "intent_type": "greeting",
-                    "extensions_used": [],
-                    "memory_retrieved": 0,
-                },
-            }
-        }
-
-
-class MemoryItem(BaseModel):
+    model_config = ConfigDict(
+        json_schema_extra={"example": _CHAT_EXAMPLE},
+        extra="ignore",
+    )
+
+
+# Serialize straight to JSON bytes in pydantic-core, bypassing FastAPI's
+# jsonable_encoder walk on the per-message chat endpoint.
+_chat_adapter: TypeAdapter[ChatResponse] = TypeAdapter(ChatResponse)
+
+
+def dump_chat(response: ChatResponse) -> bytes:
+    """Serialize a ChatResponse to JSON bytes."""
+    return _chat_adapter.dump_json(response)
+
+
+@dataclass(slots=True, frozen=True, kw_only=True, config=ConfigDict(from_attributes=True, defer_build=False))
+class MemoryItem:
     """Single memory item."""
 
     memory_id: str = Field(..., description="Unique memory ID")
@@ -94,7 +147,8 @@ class MemoryStatsResponse(BaseModel):
     avg_importance: float = Field(..., description="Average importance score")
 
 
-class ExtensionItem(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True, config=ConfigDict(from_attributes=True, defer_build=False))
+class ExtensionItem:
     """Single extension item."""
 
     name: str = Field(..., description="Extension name")
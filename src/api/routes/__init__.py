@@ -1,15 +1,24 @@
 # src/api/routes/__init__.py
-"""API Routes."""
+"""API Routes.
 
-from src.api.routes.chat import router as chat_router
-from src.api.routes.debug import router as debug_router
-from src.api.routes.extensions import router as extensions_router
-from src.api.routes.logs import router as logs_router
-from src.api.routes.memory import router as memory_router
-from src.api.routes.personality import router as personality_router
-from src.api.routes.processing import router as processing_router
-from src.api.routes.settings import router as settings_router
-from src.api.routes.telemetry import router as telemetry_router
+Routers are imported lazily on first attribute access (PEP 562) so that
+importing a single route module does not pull in every other one.
+"""
+
+import importlib
+from typing import Any
+
+_ROUTER_MODULES: dict[str, str] = {
+    "chat_router": "src.api.routes.chat",
+    "memory_router": "src.api.routes.memory",
+    "personality_router": "src.api.routes.personality",
+    "extensions_router": "src.api.routes.extensions",
+    "debug_router": "src.api.routes.debug",
+    "telemetry_router": "src.api.routes.telemetry",
+    "processing_router": "src.api.routes.processing",
+    "logs_router": "src.api.routes.logs",
+    "settings_router": "src.api.routes.settings",
+}
 
 __all__ = [
     "chat_router",
@@ -22,3 +31,12 @@
     "logs_router",
     "settings_router",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _ROUTER_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(module_path).router
+    globals()[name] = router
+    return router
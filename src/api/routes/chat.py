@@ -1,19 +1,22 @@
 # src/api/routes/chat.py
 """Chat API routes for main conversation endpoint."""
 
-import json
+import asyncio
 import re
-import uuid
-from datetime import datetime
+import secrets
+import time
+from functools import lru_cache
 from typing import Any, AsyncGenerator
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 
 from src.api.deps import get_memory_manager, get_sena
 from src.api.models.requests import ChatRequest
-from src.api.models.responses import ChatMetadata, ChatResponse, ErrorResponse
+from src.api.models.responses import ChatMetadata, ChatResponse, ErrorResponse, ORJSONResponse, dump_chat
+from src.core.constants import ModelType
 from src.core.sena import Sena
+from src.llm.prompts.intent_prompts import SESSION_TITLE_PROMPT
 from src.memory.manager import MemoryManager
 from src.utils.logger import logger
 
@@ -23,8 +26,10 @@
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Possessive \s++ and an atomic alternation keep the engine from re-trying
+# every whitespace split / filler word when the tail fails to match.
 _REMEMBER_RE = re.compile(
-    r"^remember\s+(?:this|that|these|those|the\s+following|following)?\s*:?\s*(.+)",
+    r"^remember\s++(?>this|that|these|those|the\s+following|following)?\s*:?\s*(.+)",
     re.IGNORECASE | re.DOTALL,
 )
 
@@ -38,11 +43,102 @@ def _extract_remember_content(message: str) -> str | None:
     - "remember: my API key is abc123"  → "my API key is abc123"
     - "remember my birthday is March 15"  → "my birthday is March 15"
     """
-    m = _REMEMBER_RE.match(message.strip())
+    text = message.lstrip()
+    # Cheap prefix gate — almost no messages start with "remember", so skip the regex
+    if text[:8].lower() != "remember":
+        return None
+    # Replayed messages hit the cache; don't pin oversized inputs in it
+    if len(text) > _REMEMBER_CACHE_MAX_LEN:
+        return _parse_remember(text)
+    return _parse_remember_cached(text)
+
+
+def _parse_remember(text: str) -> str | None:
+    m = _REMEMBER_RE.match(text)
     if not m:
         return None
-    content = m.group(1).strip().lstrip(":").strip()
-    return content if content else None
+    # Same as group(1).strip().lstrip(":").strip(), but on indices so only the
+    # final slice allocates
+    start, end = m.span(1)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    while start < end and text[start] == ":":
+        start += 1
+    while start < end and text[start].isspace():
+        start += 1
+    return text[start:end] if start < end else None
+
+
+_REMEMBER_CACHE_MAX_LEN = 512
+_parse_remember_cached = lru_cache(maxsize=1024)(_parse_remember)
+
+
+# The title prompt only has a single {message} hole — split it once instead of
+# re-parsing the template with str.format() on every request
+_TITLE_PREFIX, _, _TITLE_SUFFIX = SESSION_TITLE_PROMPT.partition("{message}")
+
+
+def _response_meta(response: Any) -> tuple[str, str, float, int]:
+    """Return (content, model, duration_ms, total_tokens) from a Sena response in one pass."""
+    d = getattr(response, "__dict__", None)
+    if not d:
+        # Slotted / non-dataclass responses — fall back to plain attribute lookups
+        d = {key: getattr(response, key, None) for key in ("content", "response", "model", "duration_ms", "total_tokens")}
+    return (
+        d.get("content") or d.get("response") or "",
+        d.get("model") or "ollama",
+        float(d.get("duration_ms") or 0),
+        int(d.get("total_tokens") or 0),
+    )
+
+
+def _local_iso() -> str:
+    """Second-resolution local ISO timestamp without building a datetime object."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+
+
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+
+# Strong references to detached learnings tasks so they are not GC'd mid-flight
+_background_tasks: set[asyncio.Task] = set()
+
+# How long shutdown lets in-flight learnings extraction finish before cancelling it
+_DRAIN_TIMEOUT_SECONDS = 5.0
+
+
+async def drain_background_tasks(timeout: float = _DRAIN_TIMEOUT_SECONDS) -> None:
+    """Wait briefly for detached learnings tasks, then cancel any still running.
+
+    Called on shutdown before Sena and the database are closed underneath them.
+    """
+    if not _background_tasks:
+        return
+    _, pending = await asyncio.wait(set(_background_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.info(f"Cancelled {len(pending)} unfinished learnings extraction task(s) on shutdown")
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _extract_learnings(memory_mgr: MemoryManager, session_id: str) -> None:
+    """Extract learnings from the current conversation and store them."""
+    try:
+        conversation = await memory_mgr.get_conversation_context()
+        await memory_mgr.extract_and_store_learnings(
+            conversation=conversation,
+            metadata={
+                "session_id": session_id,
+                "context": "Auto-extracted from conversation",
+                "origin": "auto_extraction",
+            },
+        )
+        logger.debug("Learnings extracted successfully")
+    except Exception as learn_err:
+        logger.warning(f"Learning extraction error: {learn_err}", exc_info=True)
 
 
 @router.post(
@@ -57,29 +153,31 @@ async def chat(
     request: ChatRequest,
     sena: Sena = Depends(get_sena),
     memory_mgr: MemoryManager = Depends(get_memory_manager),
-) -> ChatResponse:
+) -> Response:
     """Process a chat message and return response."""
     session_id = None
     try:
-        logger.info(f"=== CHAT REQUEST START ===")
-        logger.info(f"Request payload: {request.model_dump()}")
+        logger.info("=== CHAT REQUEST START ===")
+        # Lazy: model_dump() only runs when DEBUG is actually being emitted
+        logger.opt(lazy=True).debug("Request payload: {}", request.model_dump)
 
         if not request.message or not request.message.strip():
             logger.warning(f"Empty message received")
             raise HTTPException(status_code=400, detail="Message cannot be empty")
 
-        session_id = request.session_id or str(uuid.uuid4())[:12]
-        timestamp = datetime.now()
+        session_id = request.session_id or secrets.token_hex(6)
+        ts_iso = _local_iso()
 
-        logger.info(f"Processing chat - session={session_id}, message_length={len(request.message)}")
-        logger.debug(f"Message preview: {request.message[:100]}...")
+        logger.info("Processing chat - session={}, message_length={}", session_id, len(request.message))
+        logger.opt(lazy=True).debug("Message preview: {}...", lambda: request.message[:100])
 
         logger.info("Adding message to memory context...")
-        try:
-            # --- Explicit "remember ..." store detection ---
-            remember_content = _extract_remember_content(request.message)
-            if remember_content:
-                await memory_mgr.remember(
+        # --- Explicit "remember ..." store detection ---
+        remember_content = _extract_remember_content(request.message)
+        memory_ops = []
+        if remember_content:
+            memory_ops.append(
+                memory_mgr.remember(
                     content=remember_content,
                     metadata={
                         "session_id": session_id,
@@ -87,36 +185,42 @@ async def chat(
                         "context": "User explicitly asked Sena to remember this information",
                         "origin": "user_explicit",
                         "original_message": request.message,
-                        "timestamp": timestamp.isoformat(),
+                        "timestamp": ts_iso,
                     },
                 )
-                logger.info(
-                    f"Stored explicit memory: '{remember_content[:80]}...' "
-                    if len(remember_content) > 80
-                    else f"Stored explicit memory: '{remember_content}'"
-                )
-
-            # Add user message to short-term context
-            await memory_mgr.add_to_context(
+            )
+        # Add user message to short-term context
+        memory_ops.append(
+            memory_mgr.add_to_context(
                 content=request.message,
                 role="user",
-                metadata={"session_id": session_id, "timestamp": timestamp.isoformat()},
+                metadata={"session_id": session_id, "timestamp": ts_iso},
             )
-            logger.debug("Message added to memory successfully")
-        except Exception as mem_err:
+        )
+        # The explicit store and the context append are independent — overlap them
+        results = await asyncio.gather(*memory_ops, return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        for mem_err in errors:
             logger.warning(f"Memory context error: {mem_err}, continuing without memory", exc_info=True)
+        if remember_content and not isinstance(results[0], Exception):
+            logger.opt(lazy=True).info(
+                "Stored explicit memory: '{}'",
+                lambda: remember_content[:80] + "..." if len(remember_content) > 80 else remember_content,
+            )
+        if not errors:
+            logger.debug("Message added to memory successfully")
 
         # Process the message through Sena
         response = None
         response_content = ""
+        model_name, duration, total_tokens = "ollama", 0.0, 0
         try:
             response = await sena.process(
                 user_input=request.message,
                 stream=False,
             )
-            logger.debug(f"Sena processing complete, response type: {type(response)}")
-            response_content = getattr(response, "content", None) or getattr(response, "response", "")
-            logger.debug(f"Response content length: {len(response_content)}")
+            logger.debug("Sena processing complete, response type: {}", type(response))
+            response_content, model_name, duration, total_tokens = _response_meta(response)
         except Exception as process_err:
             logger.error(f"SENA PROCESSING ERROR: {type(process_err).__name__}: {process_err}", exc_info=True)
             # Fallback response
@@ -127,47 +231,34 @@ async def chat(
             await memory_mgr.add_to_context(
                 content=response_content,
                 role="assistant",
-                metadata={"session_id": session_id, "timestamp": datetime.now().isoformat()},
+                metadata={"session_id": session_id, "timestamp": _local_iso()},
             )
             logger.debug("Response stored in memory successfully")
         except Exception as mem_err:
             logger.warning(f"Memory storage error: {mem_err}", exc_info=True)
 
-        try:
-            # Extract learnings from conversation if enabled
-            conversation = await memory_mgr.get_conversation_context()
-            await memory_mgr.extract_and_store_learnings(
-                conversation=conversation,
-                metadata={
-                    "session_id": session_id,
-                    "context": "Auto-extracted from conversation",
-                    "origin": "auto_extraction",
-                },
-            )
-            logger.debug("Learnings extracted successfully")
-        except Exception as learn_err:
-            logger.warning(f"Learning extraction error: {learn_err}", exc_info=True)
+        # Learnings never appear in the response — extract them off the request path
+        task = asyncio.create_task(_extract_learnings(memory_mgr, session_id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
 
         if response:
-            model_name = getattr(response, "model", "ollama")
-            duration = float(getattr(response, "duration_ms", 0) or 0)
-            total_tokens = int(getattr(response, "total_tokens", 0) or 0)
             logger.info(
-                f"[CHAT] {model_name} | {total_tokens} tokens | {duration:.0f}ms | {len(response_content)} chars"
+                "[CHAT] {} | {} tokens | {:.0f}ms | {} chars", model_name, total_tokens, duration, len(response_content)
             )
         chat_response = ChatResponse(
             response=response_content,
             session_id=session_id,
             metadata=ChatMetadata(
-                model_used=getattr(response, "model", "ollama") if response else "ollama",
-                processing_time_ms=getattr(response, "duration_ms", 0) if response else 0,
+                model_used=model_name,
+                processing_time_ms=duration,
                 intent=None,
                 confidence=0.0,
                 tokens_used=0,
                 extensions_used=[],
             ),
         )
-        return chat_response
+        return Response(content=dump_chat(chat_response), media_type="application/json")
 
     except HTTPException as http_exc:
         logger.error(f"HTTP exception in chat: status={http_exc.status_code}, detail={http_exc.detail}")
@@ -193,21 +284,22 @@ async def stream_chat(
         if not message or not message.strip():
             raise HTTPException(status_code=400, detail="Message cannot be empty")
 
-        session_id = session_id or str(uuid.uuid4())[:12]
+        session_id = session_id or secrets.token_hex(6)
 
         # Add to memory
         await memory_mgr.add_to_context(content=message, role="user", metadata={"session_id": session_id})
 
-        async def response_generator() -> AsyncGenerator[str, None]:
+        async def response_generator() -> AsyncGenerator[bytes, None]:
             """Stream response tokens."""
             try:
                 async for chunk in sena.stream(
                     user_input=message,
                 ):
-                    yield f"data: {chunk}\n\n"
+                    # Yield bytes so Starlette doesn't re-encode every token
+                    yield _SSE_PREFIX + (chunk.encode() if isinstance(chunk, str) else chunk) + _SSE_SUFFIX
             except Exception as e:
                 logger.error(f"Stream error: {e}")
-                yield f"data: ERROR: {str(e)}\n\n"
+                yield f"data: ERROR: {str(e)}\n\n".encode()
 
         return StreamingResponse(
             response_generator(), media_type="text/event-stream", headers={"X-Session-ID": session_id}
@@ -239,16 +331,12 @@ async def generate_session_title(
         if not sena.is_initialized:
             raise HTTPException(status_code=503, detail="Sena not initialized")
 
-        from src.llm.prompts.intent_prompts import SESSION_TITLE_PROMPT
-
-        prompt = SESSION_TITLE_PROMPT.format(message=message[:300])
+        prompt = f"{_TITLE_PREFIX}{message[:300]}{_TITLE_SUFFIX}"
 
         # Use the LLM manager directly for a quick, low-cost call
         if sena._llm_manager is None:
             raise HTTPException(status_code=503, detail="LLM manager not ready")
 
-        from src.core.constants import ModelType
-
         response = await sena._llm_manager.generate(
             user_input=prompt,
             model_type=ModelType.FAST,
@@ -287,7 +375,7 @@ async def get_history(
         return {
             "session_id": session_id or "default",
             "history": context,
-            "message_count": len(context.split("\n")) if context else 0,
+            "message_count": (context.count("\n") + 1) if context else 0,
         }
 
     except HTTPException:
@@ -306,16 +394,18 @@ async def get_history(
 async def clear_context(
     session_id: str | None = None,
     memory_mgr: MemoryManager = Depends(get_memory_manager),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Clear conversation context for a session."""
     try:
         cleared = await memory_mgr.clear_context()
 
-        return {
-            "status": "success",
-            "session_id": session_id or "default",
-            "items_cleared": cleared,
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "session_id": session_id or "default",
+                "items_cleared": cleared,
+            }
+        )
 
     except Exception as e:
         logger.error(f"Clear context error: {e}")
@@ -1,11 +1,14 @@
 # src/api/routes/debug.py
 """Debug API routes for introspection and diagnostics."""
 
-from typing import Any
+import os
+from pathlib import Path
+from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 
 from src.api.deps import get_db, get_memory_manager, get_sena
+from src.api.models.responses import ORJSONResponse
 from src.core.sena import Sena
 from src.database.connection import DatabaseManager
 from src.memory.manager import MemoryManager
@@ -14,6 +17,14 @@
 router = APIRouter(prefix="/debug", tags=["Debug"])
 
 
+def _file_size(path: str) -> Optional[int]:
+    """Return the size of *path* in bytes, or None if it does not exist (single stat call)."""
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return None
+
+
 @router.get(
     "/state",
     response_model=dict[str, Any],
@@ -72,17 +83,16 @@ async def get_database_stats(
 ) -> dict[str, Any]:
     """Get database statistics."""
     try:
-        import os
-
         db_path = str(db.db_path)
-        size_bytes = os.path.getsize(db_path) if os.path.exists(db_path) else 0
+        size = _file_size(db_path)
+        size_bytes = size or 0
 
         return {
             "status": "success",
             "database": {
                 "path": db_path,
                 "size_mb": round(size_bytes / 1_048_576, 3),
-                "exists": os.path.exists(db_path),
+                "exists": size is not None,
             },
         }
     except Exception as e:
@@ -101,14 +111,12 @@ async def vacuum_database(
 ) -> dict[str, Any]:
     """Run database VACUUM to optimize storage."""
     try:
-        import os
-
         db_path = str(db.db_path)
-        size_before = os.path.getsize(db_path) if os.path.exists(db_path) else 0
+        size_before = _file_size(db_path) or 0
 
         await db.vacuum()
 
-        size_after = os.path.getsize(db_path) if os.path.exists(db_path) else 0
+        size_after = _file_size(db_path) or 0
         freed_mb = round((size_before - size_after) / 1_048_576, 3)
 
         return {
@@ -134,12 +142,10 @@ async def health_check(
 ) -> dict[str, Any]:
     """Comprehensive system health check."""
     try:
-        import os
-
         memory_ok = memory_mgr.initialized
         sena_ok = sena.is_initialized
         db_path = str(db.db_path)
-        db_ok = os.path.exists(db_path)
+        db_ok = Path(db_path).is_file()
 
         overall = "healthy" if (memory_ok and sena_ok and db_ok) else "degraded"
 
@@ -174,17 +180,19 @@ async def health_check(
 )
 async def reset_system(
     memory_mgr: MemoryManager = Depends(get_memory_manager),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Reset system state (clears short-term memory context)."""
     try:
         cleared = await memory_mgr.clear_context()
 
-        return {
-            "status": "success",
-            "message": "System state reset",
-            "items_cleared": cleared,
-            "warning": "Short-term memory context has been cleared",
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "message": "System state reset",
+                "items_cleared": cleared,
+                "warning": "Short-term memory context has been cleared",
+            }
+        )
     except Exception as e:
         logger.error(f"Reset system error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,17 +1,45 @@
 # src/api/routes/extensions.py
 """Extension API routes for extension management."""
 
+from string import Template
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from src.api.models.requests import ExtensionToggleRequest
+from src.api.models.responses import ORJSONResponse
 from src.extensions import get_extension_manager
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/extensions", tags=["Extensions"])
 
+# Scaffold returned by /generate until LLM generation lands
+_EXTENSION_SCAFFOLD = Template(
+    """# Generated extension: $name
+VERSION = "0.1.0"
+METADATA = {
+    "name": "$name",
+    "description": "$description",
+    "author": "Sena",
+    "parameters": {},
+    "requires": [],
+}
+
+
+def execute(user_input: str, context: dict, **kwargs) -> str:
+    # TODO: implement using prompt:
+    # $prompt
+    return f"Result: {user_input}"
+
+
+def validate(user_input: str, **kwargs) -> tuple[bool, str]:
+    if not user_input:
+        return False, "Input cannot be empty"
+    return True, ""
+"""
+)
+
 
 class ExtensionGenerateRequest(BaseModel):
     """Request to generate a new extension via AI."""
@@ -23,7 +51,11 @@ class ExtensionGenerateRequest(BaseModel):
 
 
 def get_ext_manager():
-    """Dependency: return the global ExtensionManager instance."""
+    """Return the global ExtensionManager instance.
+
+    Called directly from handlers rather than through Depends() — it is a
+    plain singleton, so FastAPI's dependency resolution buys nothing.
+    """
     return get_extension_manager()
 
 
@@ -33,9 +65,10 @@ def get_ext_manager():
     summary="List all extensions",
     description="Get list of all loaded extensions (core, user, generated)",
 )
-async def list_extensions(mgr=Depends(get_ext_manager)) -> dict[str, Any]:
+async def list_extensions() -> dict[str, Any]:
     """Get list of all loaded extensions."""
     try:
+        mgr = get_ext_manager()
         exts = mgr.list()
         return {"status": "success", "extensions": exts, "total": len(exts)}
     except Exception as e:
@@ -51,10 +84,10 @@ async def list_extensions(mgr=Depends(get_ext_manager)) -> dict[str, Any]:
 )
 async def get_extension(
     extension_name: str,
-    mgr=Depends(get_ext_manager),
 ) -> dict[str, Any]:
     """Get details of a specific extension."""
     try:
+        mgr = get_ext_manager()
         ext = mgr.get(extension_name)
         if not ext:
             raise HTTPException(status_code=404, detail=f"Extension '{extension_name}' not found")
@@ -82,19 +115,21 @@ async def get_extension(
 async def toggle_extension(
     extension_name: str,
     request: ExtensionToggleRequest,
-    mgr=Depends(get_ext_manager),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Toggle extension enabled/disabled status."""
     try:
+        mgr = get_ext_manager()
         if request.enabled:
             mgr.enable(extension_name)
         else:
             mgr.disable(extension_name)
-        return {
-            "status": "success",
-            "extension_name": extension_name,
-            "enabled": request.enabled,
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "extension_name": extension_name,
+                "enabled": request.enabled,
+            }
+        )
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Extension '{extension_name}' not found")
     except Exception as e:
@@ -110,16 +145,18 @@ async def toggle_extension(
 )
 async def reload_extension_endpoint(
     extension_name: str,
-    mgr=Depends(get_ext_manager),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Reload a specific extension."""
     try:
+        mgr = get_ext_manager()
         mgr.reload(extension_name)
-        return {
-            "status": "success",
-            "extension_name": extension_name,
-            "message": "Extension reloaded successfully",
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "extension_name": extension_name,
+                "message": "Extension reloaded successfully",
+            }
+        )
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Extension '{extension_name}' not found")
     except Exception as e:
@@ -140,24 +177,10 @@ async def generate_extension_endpoint(
     try:
         # Generation via LLM is not yet implemented — return a typed scaffold
         # so the frontend has something to show.
-        template = (
-            f"# Generated extension: {request.name}\n"
-            f'VERSION = "0.1.0"\n'
-            f"METADATA = {{\n"
-            f'    "name": "{request.name}",\n'
-            f'    "description": "{request.description}",\n'
-            f'    "author": "Sena",\n'
-            f'    "parameters": {{}},\n'
-            f'    "requires": [],\n'
-            f"}}\n\n\n"
-            f"def execute(user_input: str, context: dict, **kwargs) -> str:\n"
-            f"    # TODO: implement using prompt:\n"
-            f"    # {request.prompt}\n"
-            f'    return f"Result: {{user_input}}"\n\n\n'
-            f"def validate(user_input: str, **kwargs) -> tuple[bool, str]:\n"
-            f"    if not user_input:\n"
-            f'        return False, "Input cannot be empty"\n'
-            f'    return True, ""\n'
+        template = _EXTENSION_SCAFFOLD.substitute(
+            name=request.name,
+            description=request.description,
+            prompt=request.prompt,
         )
         return {
             "status": "success",
@@ -179,16 +202,18 @@ async def generate_extension_endpoint(
 )
 async def delete_extension(
     extension_name: str,
-    mgr=Depends(get_ext_manager),
-) -> dict[str, Any]:
+) -> ORJSONResponse:
     """Delete an extension."""
     try:
+        mgr = get_ext_manager()
         mgr.remove(extension_name)
-        return {
-            "status": "success",
-            "extension_name": extension_name,
-            "message": "Extension deleted",
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "extension_name": extension_name,
+                "message": "Extension deleted",
+            }
+        )
     except PermissionError:
         raise HTTPException(status_code=403, detail="Cannot delete a core extension")
     except KeyError:
@@ -206,10 +231,10 @@ async def delete_extension(
 )
 async def validate_extension(
     extension_name: str,
-    mgr=Depends(get_ext_manager),
 ) -> dict[str, Any]:
     """Validate an extension."""
     try:
+        mgr = get_ext_manager()
         result = mgr.validate(extension_name)
         return {
             "status": "success",
@@ -3,34 +3,84 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import os
 import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import BinaryIO, Callable, Iterable, Iterator
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from src.config.settings import get_app_data_dir
 from src.utils.logger import logger
 
-# In-memory watermark set by clear_logs(). Any log entry whose timestamp is
-# <= this value is hidden from all subsequent reads. Resets on process restart.
-_cleared_at: str | None = None
-
 router = APIRouter(prefix="/logs", tags=["Logs"])
 
 LOG_DIR = get_app_data_dir() / "data" / "logs"
 DEFAULT_LOG_FILE = LOG_DIR / "sena.log"
 SESSION_DIR = LOG_DIR / "sessions"
+CLEARED_AT_FILE = LOG_DIR / ".cleared_at"
+
+
+def _read_cleared_at() -> str | None:
+    try:
+        return CLEARED_AT_FILE.read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+
+# Watermark set by clear_logs(). Any log entry whose timestamp is <= this value
+# is hidden from all subsequent reads. Persisted to CLEARED_AT_FILE so a restart
+# doesn't bring cleared entries back.
+_cleared_at: str | None = _read_cleared_at()
+# Possessive quantifiers wherever the next token can't overlap the repeated one,
+# so a non-matching line fails in one pass instead of re-trying every split.
+# <location> keeps its leading whitespace (callers strip it) rather than
+# splitting it off with a backtracking \s+.
 LOG_PATTERN = re.compile(
-    r"^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\s+\|\s+"
-    r"(?P<level>[A-Z]+)\s+\|\s+(?P<location>[^-]+)-\s+(?P<message>.*)$"
+    r"^(?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3})\s++\|\s++"
+    r"(?P<level>[A-Z]++)\s++\|(?P<location>\s[^-]++)-\s++(?P<message>.*)$"
 )
-STRUCTURED_PATTERN = re.compile(r"^\[(?P<event>[A-Z_]+)\]\s+(?P<payload>\{.*\})$")
+STRUCTURED_PATTERN = re.compile(r"^\[(?P<event>[A-Z_]++)\]\s++(?P<payload>\{.*\})$")
 IGNORE_REQUEST_PATHS = ("/health", "/api/v1/logs")
 IGNORE_SOURCES = ("log_requests",)
+_REQ_RESP_PREFIXES = (">>> REQUEST", "<<< RESPONSE")
+
+# Block size for chunked log reads (tail parsing and source scans)
+_READ_BLOCK_SIZE = 65536
+
+
+def _ignore_matcher(patterns: Iterable[str], flags: int = 0) -> Callable[[str], bool]:
+    """Build a ``text -> bool`` check for any of the literal *patterns*.
+
+    Patterns are grouped by first character into one alternation per group:
+    an alternation whose branches share a literal first byte lets ``_sre``
+    scan for that byte instead of trying every branch at every position.
+    A lone case-sensitive pattern skips the regex engine for a plain ``in``.
+    """
+    patterns = tuple(patterns)
+    if len(patterns) == 1 and not flags & re.IGNORECASE:
+        needle = patterns[0]
+        return lambda text: needle in text
+    groups: dict[str, list[str]] = {}
+    for pattern in patterns:
+        key = pattern[:1].lower() if flags & re.IGNORECASE else pattern[:1]
+        groups.setdefault(key, []).append(re.escape(pattern))
+    searches = [re.compile("|".join(group), flags).search for group in groups.values()]
+    if len(searches) == 1:
+        search = searches[0]
+        return lambda text: search(text) is not None
+    return lambda text: any(search(text) for search in searches)
+
+
+_is_ignored_message = _ignore_matcher(IGNORE_REQUEST_PATHS)
+_is_ignored_source = _ignore_matcher(IGNORE_SOURCES, re.IGNORECASE)
 
 
 def _iter_log_files() -> list[Path]:
@@ -43,65 +93,212 @@ def _iter_log_files() -> list[Path]:
     return files
 
 
-def _parse_line(line: str) -> dict | None:
+def _iter_lines_reverse(
+    fh: BinaryIO, end: int | None = None, block_size: int = _READ_BLOCK_SIZE
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(offset, line)`` for a binary file newest-first, reading fixed-size blocks back from *end*.
+
+    Callers usually stop after a few hundred entries, so only the tail of a
+    multi-MB log is ever read. *end* defaults to EOF.
+    """
+    offset = fh.seek(0, os.SEEK_END) if end is None else end
+    carry = b""
+    while offset > 0:
+        read_size = min(block_size, offset)
+        offset -= read_size
+        fh.seek(offset)
+        chunk = fh.read(read_size) + carry
+        lines = chunk.split(b"\n")
+        # The first piece may be the tail of a line that starts in an earlier block
+        carry = lines[0]
+        pos = offset + len(chunk)
+        for raw in reversed(lines[1:]):
+            pos -= len(raw)
+            yield pos, raw.decode("utf-8", errors="ignore")
+            pos -= 1
+    if carry:
+        yield 0, carry.decode("utf-8", errors="ignore")
+
+
+def _parse_source(line: str) -> str | None:
+    """Return just the location field of a log line — no message/metadata work."""
+    if not line[:1].isspace() and (len(line) < 24 or line[4] != "-" or line[7] != "-" or line[10] != " "):
+        return None
     match = LOG_PATTERN.match(line.strip())
+    return match.group("location").strip() if match else None
+
+
+def _parse_line(line: str) -> dict | None:
+    # Cheap shape check for the "YYYY-MM-DD HH:" prefix before running the regex.
+    # Lines with leading whitespace still go through strip() + regex as before.
+    if not line[:1].isspace() and (len(line) < 24 or line[4] != "-" or line[7] != "-" or line[10] != " "):
+        return None
+    raw = line.strip()
+    match = LOG_PATTERN.match(raw)
     if not match:
         return None
-    location = match.group("location").strip()
-    message = match.group("message").strip()
+    # One groups() call instead of four named group() lookups
+    timestamp, level, location, message = match.groups()
+    location = location.strip()
+    message = message.strip()
     metadata = None
     event = None
-    structured = STRUCTURED_PATTERN.match(message)
+    structured = STRUCTURED_PATTERN.match(message) if message.startswith("[") else None
     if structured:
         event = structured.group("event").lower()
         payload = structured.group("payload")
         try:
-            metadata = json.loads(payload)
-        except json.JSONDecodeError:
+            metadata = orjson.loads(payload)
+        except orjson.JSONDecodeError:
             metadata = None
         message = f"{event} metadata"
     return {
-        "timestamp": match.group("timestamp"),
-        "level": match.group("level").lower(),
+        "timestamp": timestamp,
+        "level": level.lower(),
         "source": location,
         "message": message,
         "event": event,
         "metadata": metadata,
-        "raw": line.strip(),
+        "raw": raw,
     }
 
 
-def _load_logs(limit: int, level: str, source: str) -> list[dict]:
-    entries: list[dict] = []
-    for log_file in _iter_log_files():
-        try:
-            with log_file.open("r", encoding="utf-8", errors="ignore") as fh:
-                lines = fh.readlines()
-        except FileNotFoundError:
-            continue
-
-        for line in reversed(lines):
+_PARSE_CACHE_MAX_ENTRIES = 5000
+
+
+@dataclass
+class _ParsedTail:
+    """Most recent parsed entries of one log file, kept warm between requests."""
+
+    # (st_ino, st_mtime_ns, st_size) of the file when it was last refreshed
+    stat_key: tuple[int, int, int]
+    # Offset just past the last complete line that has been parsed
+    size: int
+    # Offset of the oldest line scanned into ``entries``; 0 means the whole file is cached
+    start: int
+    # (line offset, parsed entry), oldest first
+    entries: deque[tuple[int, dict]] = field(default_factory=lambda: deque(maxlen=_PARSE_CACHE_MAX_ENTRIES))
+    # Parsed trailing line that has no newline yet — re-read on every refresh
+    partial: dict | None = None
+
+
+_PARSE_CACHE: dict[Path, _ParsedTail] = {}
+# Readers run in worker threads (asyncio.to_thread), so cache refreshes and
+# the iteration over cached entries must not interleave
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _parsed_tail(log_file: Path, fh: BinaryIO) -> _ParsedTail:
+    """Return the cached tail for *log_file*, parsing only what was appended since the last call."""
+    st = os.fstat(fh.fileno())
+    stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(log_file)
+    if cached is not None and cached.stat_key == stat_key:
+        return cached
+
+    if cached is None or cached.stat_key[0] != st.st_ino or st.st_size < cached.size:
+        # Cold or rotated: fill the cache from the end of the file backwards
+        cached = _ParsedTail(stat_key=stat_key, size=0, start=0)
+        lines = _iter_lines_reverse(fh)
+        first = next(lines, None)
+        if first is not None:
+            cached.size, last = first
+            cached.partial = _parse_line(last) if last else None
+            cached.start = cached.size
+        for offset, line in lines:
             parsed = _parse_line(line)
-            if not parsed:
-                continue
-            # Skip entries that predate the last clear() call. Because we
-            # iterate newest-first, once we cross the watermark everything
-            # remaining is also older — break early for efficiency.
-            if _cleared_at and parsed["timestamp"] <= _cleared_at:
+            # Nothing at or before the clear() watermark is ever shown again, so
+            # the backwards fill can stop there instead of reading a full cache's worth
+            if parsed and _cleared_at and parsed["timestamp"] <= _cleared_at:
                 break
-            if any(source in parsed["source"].lower() for source in IGNORE_SOURCES):
-                continue
-            if parsed["message"].startswith(">>> REQUEST") or parsed["message"].startswith("<<< RESPONSE"):
-                continue
-            if any(path in parsed["message"] for path in IGNORE_REQUEST_PATHS):
-                continue
-            if level != "all" and parsed["level"] != level:
-                continue
-            if source != "all" and source.lower() not in parsed["source"].lower():
+            cached.start = offset
+            if parsed:
+                cached.entries.appendleft((offset, parsed))
+                if len(cached.entries) == cached.entries.maxlen:
+                    break
+        _PARSE_CACHE[log_file] = cached
+        return cached
+
+    # Warm: parse only the bytes appended since the last refresh
+    fh.seek(cached.size)
+    cached.partial = None
+    offset = cached.size
+    for raw in fh:
+        if not raw.endswith(b"\n"):
+            cached.partial = _parse_line(raw.decode("utf-8", errors="ignore"))
+            break
+        parsed = _parse_line(raw.decode("utf-8", errors="ignore"))
+        if parsed:
+            cached.entries.append((offset, parsed))
+        offset += len(raw)
+    cached.size = offset
+    cached.stat_key = stat_key
+    if len(cached.entries) == cached.entries.maxlen:
+        cached.start = cached.entries[0][0]
+    return cached
+
+
+def _iter_parsed_reverse(
+    log_file: Path,
+    fh: BinaryIO,
+    level_token: str | None = None,
+    source_lc: str | None = None,
+) -> Iterator[dict]:
+    """Yield parsed entries of *log_file* newest-first, served from the tail cache where possible.
+
+    ``level_token`` / ``source_lc`` let the uncached scan skip raw lines that
+    cannot pass the caller's filters without parsing them. Entries are not
+    filtered here — callers still apply their own checks.
+    """
+    tail = _parsed_tail(log_file, fh)
+    if tail.partial:
+        yield tail.partial
+    for _, parsed in reversed(tail.entries):
+        yield parsed
+    # Older than anything cached — fall back to scanning the file backwards
+    for _, line in _iter_lines_reverse(fh, end=tail.start):
+        if level_token and level_token not in line:
+            continue
+        if source_lc and source_lc not in line.lower():
+            continue
+        parsed = _parse_line(line)
+        if parsed:
+            yield parsed
+
+
+def _load_logs(files: Iterable[Path], limit: int, level: str, source: str) -> list[dict]:
+    entries: list[dict] = []
+    # Substring prefilters: the upper-case level and the location both appear verbatim in the raw line
+    level_token = level.upper() if level != "all" else None
+    source_lc = source.lower() if source != "all" else None
+    with _PARSE_CACHE_LOCK:
+        for log_file in files:
+            try:
+                fh = log_file.open("rb")
+            except FileNotFoundError:
+                _PARSE_CACHE.pop(log_file, None)
                 continue
-            entries.append(parsed)
-            if len(entries) >= limit:
-                return entries
+
+            with fh:
+                for parsed in _iter_parsed_reverse(log_file, fh, level_token, source_lc):
+                    # Skip entries that predate the last clear() call. Because we
+                    # iterate newest-first, once we cross the watermark everything
+                    # remaining is also older — break early for efficiency.
+                    if _cleared_at and parsed["timestamp"] <= _cleared_at:
+                        break
+                    if _is_ignored_source(parsed["source"]):
+                        continue
+                    if parsed["message"].startswith(_REQ_RESP_PREFIXES):
+                        continue
+                    if _is_ignored_message(parsed["message"]):
+                        continue
+                    if level != "all" and parsed["level"] != level:
+                        continue
+                    if source != "all" and source.lower() not in parsed["source"].lower():
+                        continue
+                    entries.append(parsed)
+                    if len(entries) >= limit:
+                        return entries
     return entries
 
 
@@ -120,14 +317,17 @@ async def get_logs(
     if level not in {"all", "debug", "info", "warning", "error", "critical"}:
         raise HTTPException(status_code=400, detail="Invalid log level filter")
 
-    entries = _load_logs(limit=limit, level=level, source=source)
+    # Glob once and reuse the list for both loading and the "files" field.
+    # File I/O and parsing run in a worker thread to keep the event loop free.
+    files = await asyncio.to_thread(_iter_log_files)
+    entries = await asyncio.to_thread(_load_logs, files, limit, level, source)
 
     return {
         "logs": entries,
         "count": len(entries),
         "level_filter": level,
         "source_filter": source,
-        "files": [f.name for f in _iter_log_files()],
+        "files": [f.name for f in files],
     }
 
 
@@ -138,16 +338,7 @@ async def get_logs(
     description="Collect unique source entries from existing log files.",
 )
 async def get_log_sources():
-    sources: set[str] = set()
-    for log_file in _iter_log_files():
-        try:
-            with log_file.open("r", encoding="utf-8", errors="ignore") as fh:
-                for line in fh:
-                    parsed = _parse_line(line)
-                    if parsed:
-                        sources.add(parsed["source"])
-        except FileNotFoundError:
-            continue
+    sources = await asyncio.to_thread(_scan_sources)
 
     return {
         "sources": sorted(sources),
@@ -155,6 +346,61 @@ async def get_log_sources():
     }
 
 
+@dataclass
+class _SourceScan:
+    """Sources seen in one log file up to ``offset`` (end of the last complete line)."""
+
+    inode: int
+    offset: int = 0
+    sources: set[str] = field(default_factory=set)
+
+
+# Per-file source sets, extended from ``offset`` on each call so /sources only
+# parses lines appended since the last request; a full scan happens on cold
+# start or when a file is rotated/truncated.
+_SOURCE_CACHE: dict[Path, _SourceScan] = {}
+_SOURCE_CACHE_LOCK = threading.Lock()
+
+
+def _scan_sources() -> set[str]:
+    sources: set[str] = set()
+    files = _iter_log_files()
+    with _SOURCE_CACHE_LOCK:
+        for stale in _SOURCE_CACHE.keys() - set(files):
+            del _SOURCE_CACHE[stale]
+        for log_file in files:
+            try:
+                with log_file.open("rb") as fh:
+                    st = os.fstat(fh.fileno())
+                    cached = _SOURCE_CACHE.get(log_file)
+                    if cached is None or cached.inode != st.st_ino or st.st_size < cached.offset:
+                        cached = _SourceScan(inode=st.st_ino)
+                        _SOURCE_CACHE[log_file] = cached
+                    fh.seek(cached.offset)
+                    # Scan in bounded blocks so a cold cache never holds a whole log
+                    # in memory. Only complete lines advance the offset; a trailing
+                    # partial line is carried between blocks and re-read next time.
+                    partial = b""
+                    while block := fh.read(_READ_BLOCK_SIZE):
+                        complete, newline, partial = (partial + block).rpartition(b"\n")
+                        if newline:
+                            for line in complete.decode("utf-8", errors="ignore").split("\n"):
+                                location = _parse_source(line)
+                                if location is not None:
+                                    cached.sources.add(location)
+                            cached.offset += len(complete) + 1
+            except FileNotFoundError:
+                _SOURCE_CACHE.pop(log_file, None)
+                continue
+            # The partial line is still counted for this response
+            sources |= cached.sources
+            if partial:
+                location = _parse_source(partial.decode("utf-8", errors="ignore"))
+                if location is not None:
+                    sources.add(location)
+    return sources
+
+
 class SummarizeRequest(BaseModel):
     messages: list[str]
 
@@ -204,6 +450,33 @@ async def summarize_logs(body: SummarizeRequest) -> dict:
     return {"status": "success", "summary": summary or "Processing complete"}
 
 
+def _delete_session_files() -> list[str]:
+    """Best-effort delete of session files (they are not held open by loguru)."""
+    deleted_sessions: list[str] = []
+    if not SESSION_DIR.exists():
+        return deleted_sessions
+    # scandir hands back names without a per-entry stat, and os.unlink takes the
+    # entry path as-is instead of re-resolving a Path.
+    with os.scandir(SESSION_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if not (name.startswith("session_") and name.endswith(".log")):
+                continue
+            try:
+                os.unlink(entry.path)
+                deleted_sessions.append(name)
+            except OSError:
+                continue
+            with _PARSE_CACHE_LOCK:
+                _PARSE_CACHE.pop(SESSION_DIR / name, None)
+    return deleted_sessions
+
+
+def _write_cleared_at(value: str) -> None:
+    CLEARED_AT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CLEARED_AT_FILE.write_text(value, encoding="utf-8")
+
+
 @router.post(
     "/clear",
     response_model=dict,
@@ -217,15 +490,11 @@ async def clear_logs():
     # Record watermark — same millisecond-precision format loguru writes.
     _cleared_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:23]
 
-    # Best-effort delete of session files (they are not held open by loguru).
-    deleted_sessions: list[str] = []
-    if SESSION_DIR.exists():
-        for session_file in SESSION_DIR.glob("session_*.log"):
-            try:
-                session_file.unlink()
-                deleted_sessions.append(session_file.name)
-            except (FileNotFoundError, PermissionError, OSError):
-                pass
+    deleted_sessions = await asyncio.to_thread(_delete_session_files)
+    try:
+        await asyncio.to_thread(_write_cleared_at, _cleared_at)
+    except OSError as e:
+        logger.warning(f"Could not persist log clear watermark: {e}")
 
     return {
         "status": "success",
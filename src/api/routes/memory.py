@@ -13,13 +13,15 @@
 
 
 def _enrich_memory(item: dict[str, Any]) -> dict[str, Any]:
-    """Flatten metadata fields (context, origin) to the top level for the UI."""
+    """Flatten metadata fields (context, origin) to the top level for the UI.
+
+    Mutates *item* in place — the manager hands back fresh dicts per call,
+    so there is no need to copy each one.
+    """
     meta = item.get("metadata") or {}
-    return {
-        **item,
-        "context": meta.get("context", ""),
-        "origin": meta.get("origin", meta.get("source", "unknown")),
-    }
+    item["context"] = meta.get("context", "")
+    item["origin"] = meta.get("origin", meta.get("source", "unknown"))
+    return item
 
 
 @router.get(
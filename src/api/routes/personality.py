@@ -14,15 +14,22 @@
 - DELETE /api/v1/personality/{id}       - Delete a fragment
 - POST /api/v1/personality/{id}/approve - Approve a pending fragment
 - POST /api/v1/personality/{id}/reject  - Reject a pending fragment
+- POST /api/v1/personality/bulk         - Approve/reject/delete many fragments at once
 - GET  /api/v1/personality/audit        - Audit log (all fragments)
 - GET  /api/v1/personality/{id}/audit   - Audit log for a specific fragment
 """
 
-from typing import Any, Optional
+from collections import Counter
+from typing import Any, AsyncIterator, Literal, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from src.api.models.responses import ORJSONResponse, etag_matches
+from src.memory.manager import MemoryManager
+from src.memory.personality import PersonalityManager
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/personality", tags=["Personality"])
@@ -62,6 +69,15 @@ class ApproveRejectRequest(BaseModel):
     reason: Optional[str] = Field(None, description="Optional human-readable reason for this decision.")
 
 
+class BulkActionRequest(BaseModel):
+    """Request body for applying approve/reject/delete to many fragments at once."""
+
+    approve: list[str] = Field(default_factory=list, max_length=1000, description="Fragment UUIDs to approve.")
+    reject: list[str] = Field(default_factory=list, max_length=1000, description="Fragment UUIDs to reject.")
+    delete: list[str] = Field(default_factory=list, max_length=1000, description="Fragment UUIDs to delete.")
+    reason: Optional[str] = Field(None, description="Optional reason recorded for approvals/rejections.")
+
+
 class InferRequest(BaseModel):
     """Request body for triggering manual inference."""
 
@@ -77,47 +93,101 @@ class InferRequest(BaseModel):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-async def _get_manager():
-    """Get (and lazily initialize) the PersonalityManager singleton."""
-    from src.memory.personality import PersonalityManager
+# Resolved once the manager has initialized successfully; the hot path is a
+# single global read. Kept async so FastAPI calls it inline instead of
+# dispatching a sync dependency to the threadpool.
+_manager: Optional[PersonalityManager] = None
+
+
+async def get_manager() -> PersonalityManager:
+    """Return the initialized PersonalityManager singleton.
+
+    The server lifespan initializes it at startup; the lazy path only runs if
+    that failed or the router is mounted elsewhere (e.g. tests).
+    """
+    global _manager
+    if _manager is not None:
+        return _manager
 
     mgr = PersonalityManager.get_instance()
     if not mgr._initialized:
         ok = await mgr.initialize()
         if not ok:
             raise HTTPException(status_code=503, detail="PersonalityManager not available")
+    _manager = mgr
     return mgr
 
 
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a bodyless 304 if the client already holds the current version."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # List / Stats / Preview
 # ──────────────────────────────────────────────────────────────────────────────
 
 
-@router.get("", response_model=dict)
+@router.get("", response_model=None)
 async def list_fragments(
+    request: Request,
     status: Optional[str] = Query(None, description="Filter by status: approved | pending | rejected"),
     fragment_type: Optional[str] = Query(None, description="Filter by type: explicit | inferred"),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-) -> dict:
+    format: Literal["json", "ndjson"] = Query(
+        "json", description="'ndjson' streams one fragment per line instead of a single JSON body"
+    ),
+    mgr: PersonalityManager = Depends(get_manager),
+) -> Response:
     """List personality fragments with optional filters.
 
     Returns all fragments (default: no filter) or filtered by status/type.
+    With format=ndjson the rows are streamed as they are read, without a total;
+    a read error ends the stream with an {"error": ...} line.
+    JSON responses carry an ETag; a matching If-None-Match gets a 304 without
+    touching the DB.
     """
+    if format == "ndjson":
+
+        async def stream_rows() -> AsyncIterator[bytes]:
+            try:
+                async for fragment in mgr.iter_fragments(
+                    status=status, fragment_type=fragment_type, limit=limit, offset=offset
+                ):
+                    yield orjson.dumps(fragment) + b"\n"
+            except Exception as e:
+                # Headers are already sent, so the failure is reported in-band
+                # as a final line instead of passing off a truncated list as complete.
+                yield orjson.dumps({"error": str(e)}) + b"\n"
+
+        return StreamingResponse(stream_rows(), media_type="application/x-ndjson")
+
+    etag = mgr.etag()
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+
     try:
-        mgr = await _get_manager()
-        fragments = await mgr.get_all_fragments(
+        fragments, total = await mgr.get_fragments_page(
             status=status,
             fragment_type=fragment_type,
             limit=limit,
+            offset=offset,
+        )
+        # Returned as a Response so the page of fragments is serialized once by
+        # orjson instead of first going through response_model validation.
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "data": fragments,
+                "total": total,
+                "offset": offset,
+                "limit": limit,
+            },
+            headers={"ETag": etag},
         )
-        return {
-            "status": "success",
-            "data": fragments,
-            "total": len(fragments),
-            "offset": offset,
-        }
     except HTTPException:
         raise
     except Exception as e:
@@ -125,14 +195,22 @@ async def list_fragments(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/pending", response_model=dict)
-async def list_pending() -> dict:
+@router.get("/pending", response_model=None)
+async def list_pending(
+    request: Request,
+    response: Response,
+    mgr: PersonalityManager = Depends(get_manager),
+) -> dict | Response:
     """Return all fragments awaiting user approval.
 
     These are inferred fragments that have not yet been approved or rejected.
     """
+    etag = mgr.etag()
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+    response.headers["ETag"] = etag
+
     try:
-        mgr = await _get_manager()
         pending = await mgr.get_pending_fragments()
         return {
             "status": "success",
@@ -147,10 +225,18 @@ async def list_pending() -> dict:
 
 
 @router.get("/stats", response_model=dict)
-async def get_stats() -> dict:
+async def get_stats(
+    request: Request,
+    response: Response,
+    mgr: PersonalityManager = Depends(get_manager),
+) -> dict | Response:
     """Return aggregate statistics about personality fragments."""
+    etag = mgr.etag()
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+    response.headers["ETag"] = etag
+
     try:
-        mgr = await _get_manager()
         stats = await mgr.get_stats()
         return {
             "status": "success",
@@ -164,13 +250,22 @@ async def get_stats() -> dict:
 
 
 @router.get("/preview", response_model=dict)
-async def preview_personality_block() -> dict:
+async def preview_personality_block(
+    request: Request,
+    response: Response,
+    mgr: PersonalityManager = Depends(get_manager),
+) -> dict | Response:
     """Preview the composed personality block as it would appear in the system prompt.
 
-    Always returns a freshly built block (bypasses cache).
+    Returns the cached block; it is rebuilt after approved fragments or
+    personality settings change.
     """
+    etag = mgr.etag()
+    if (not_modified := _not_modified(request, etag)) is not None:
+        return not_modified
+    response.headers["ETag"] = etag
+
     try:
-        mgr = await _get_manager()
         block = await mgr.get_preview_block()
         return {
             "status": "success",
@@ -183,20 +278,22 @@ async def preview_personality_block() -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/audit", response_model=dict)
+@router.get("/audit", response_model=None)
 async def get_audit_log(
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
-) -> dict:
+    mgr: PersonalityManager = Depends(get_manager),
+) -> ORJSONResponse:
     """Return the global personality audit log (newest first)."""
     try:
-        mgr = await _get_manager()
         entries = await mgr.get_audit_log(limit=limit)
-        return {
-            "status": "success",
-            "data": entries,
-            "total": len(entries),
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "data": entries,
+                "total": len(entries),
+            }
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -210,13 +307,12 @@ async def get_audit_log(
 
 
 @router.post("", response_model=dict, status_code=201)
-async def create_fragment(body: CreateFragmentRequest) -> dict:
+async def create_fragment(body: CreateFragmentRequest, mgr: PersonalityManager = Depends(get_manager)) -> dict:
     """Store a user-explicitly-stated personality fact.
 
     Explicit fragments are immediately approved and added to the personality block.
     """
     try:
-        mgr = await _get_manager()
         fragment = await mgr.store_explicit(
             content=body.content,
             category=body.category,
@@ -245,22 +341,18 @@ async def create_fragment(body: CreateFragmentRequest) -> dict:
 
 
 @router.post("/infer", response_model=dict)
-async def trigger_inference(body: InferRequest) -> dict:
+async def trigger_inference(body: InferRequest, mgr: PersonalityManager = Depends(get_manager)) -> dict:
     """Manually trigger personality inference from a conversation.
 
     If no conversation text is provided, uses the most recent session context.
     Returns a list of newly created fragments (may be pending or auto-approved).
     """
     try:
-        mgr = await _get_manager()
-
         conversation_text = body.conversation
 
         # Fall back to recent memory context if no conversation provided
         if not conversation_text:
             try:
-                from src.memory.manager import MemoryManager
-
                 mem_mgr = MemoryManager.get_instance()
                 conversation_text = await mem_mgr.get_conversation_context()
             except Exception as e:
@@ -278,8 +370,9 @@ async def trigger_inference(body: InferRequest) -> dict:
             source=body.source or "manual_trigger",
         )
 
-        pending_count = sum(1 for f in fragments if f.get("status") == "pending")
-        approved_count = sum(1 for f in fragments if f.get("status") == "approved")
+        status_counts = Counter(f.get("status") for f in fragments)
+        pending_count = status_counts["pending"]
+        approved_count = status_counts["approved"]
 
         return {
             "status": "success",
@@ -299,17 +392,47 @@ async def trigger_inference(body: InferRequest) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Bulk operations
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+@router.post("/bulk", response_model=dict)
+async def bulk_action(body: BulkActionRequest, mgr: PersonalityManager = Depends(get_manager)) -> dict:
+    """Approve, reject and delete many fragments in one request.
+
+    Uses one lookup and one write transaction for the whole batch instead of a
+    request (and DB commit) per fragment.
+    """
+    try:
+        results = await mgr.bulk_apply(
+            approve=body.approve,
+            reject=body.reject,
+            delete=body.delete,
+            reason=body.reason,
+        )
+        applied = sum(ok for outcome in results.values() for ok in outcome.values())
+        return {
+            "status": "success",
+            "data": results,
+            "message": f"Applied {applied} personality change(s)",
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error applying bulk personality action: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Single fragment operations
 # ──────────────────────────────────────────────────────────────────────────────
 
 
 @router.get("/{fragment_id}", response_model=dict)
-async def get_fragment(fragment_id: str) -> dict:
+async def get_fragment(fragment_id: str, mgr: PersonalityManager = Depends(get_manager)) -> dict:
     """Fetch a single personality fragment by its UUID."""
     try:
-        mgr = await _get_manager()
-
         if not mgr._repo:
             raise HTTPException(status_code=503, detail="Personality repository not available")
 
@@ -329,14 +452,16 @@ async def get_fragment(fragment_id: str) -> dict:
 
 
 @router.put("/{fragment_id}", response_model=dict)
-async def edit_fragment(fragment_id: str, body: EditFragmentRequest) -> dict:
+async def edit_fragment(
+    fragment_id: str,
+    body: EditFragmentRequest,
+    mgr: PersonalityManager = Depends(get_manager),
+) -> dict:
     """Edit a fragment's content.
 
     If approve=True (default), the fragment is also approved immediately after editing.
     """
     try:
-        mgr = await _get_manager()
-
         if body.approve:
             success = await mgr.edit_and_approve(
                 fragment_id=fragment_id,
@@ -348,6 +473,8 @@ async def edit_fragment(fragment_id: str, body: EditFragmentRequest) -> dict:
             if not mgr._repo:
                 raise HTTPException(status_code=503, detail="Personality repository not available")
             success = await mgr._repo.update_fragment(fragment_id, content=body.content)
+            if success:
+                mgr.invalidate_cache()
 
         if not success:
             raise HTTPException(
@@ -367,10 +494,9 @@ async def edit_fragment(fragment_id: str, body: EditFragmentRequest) -> dict:
 
 
 @router.delete("/{fragment_id}", response_model=dict)
-async def delete_fragment(fragment_id: str) -> dict:
+async def delete_fragment(fragment_id: str, mgr: PersonalityManager = Depends(get_manager)) -> dict:
     """Permanently delete a personality fragment."""
     try:
-        mgr = await _get_manager()
         success = await mgr.delete_fragment(fragment_id)
 
         if not success:
@@ -388,13 +514,16 @@ async def delete_fragment(fragment_id: str) -> dict:
 
 
 @router.post("/{fragment_id}/approve", response_model=dict)
-async def approve_fragment(fragment_id: str, body: Optional[ApproveRejectRequest] = None) -> dict:
+async def approve_fragment(
+    fragment_id: str,
+    body: Optional[ApproveRejectRequest] = None,
+    mgr: PersonalityManager = Depends(get_manager),
+) -> dict:
     """Approve a pending personality fragment.
 
     Once approved, the fragment will be included in Sena's system prompt personality block.
     """
     try:
-        mgr = await _get_manager()
         success = await mgr.approve_fragment(fragment_id=fragment_id, reason=body.reason if body else None)
 
         if not success:
@@ -415,14 +544,17 @@ async def approve_fragment(fragment_id: str, body: Optional[ApproveRejectRequest
 
 
 @router.post("/{fragment_id}/reject", response_model=dict)
-async def reject_fragment(fragment_id: str, body: Optional[ApproveRejectRequest] = None) -> dict:
+async def reject_fragment(
+    fragment_id: str,
+    body: Optional[ApproveRejectRequest] = None,
+    mgr: PersonalityManager = Depends(get_manager),
+) -> dict:
     """Reject a pending personality fragment.
 
     Rejected fragments are kept in the database for audit purposes but will not
     be included in the personality block.
     """
     try:
-        mgr = await _get_manager()
         success = await mgr.reject_fragment(fragment_id=fragment_id, reason=body.reason if body else None)
 
         if not success:
@@ -446,10 +578,10 @@ async def reject_fragment(fragment_id: str, body: Optional[ApproveRejectRequest]
 async def get_fragment_audit_log(
     fragment_id: str,
     limit: int = Query(50, ge=1, le=200),
+    mgr: PersonalityManager = Depends(get_manager),
 ) -> dict:
     """Return the audit log for a specific personality fragment."""
     try:
-        mgr = await _get_manager()
         entries = await mgr.get_audit_log(fragment_id=fragment_id, limit=limit)
         return {
             "status": "success",
@@ -9,12 +9,17 @@
 
 from __future__ import annotations
 
+import secrets
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from typing import Any, Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from src.api.models.responses import ORJSONResponse, etag_matches
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/processing", tags=["Processing"])
@@ -28,16 +33,65 @@
 # ---------------------------------------------------------------------------
 
 STAGE_NAMES: list[str] = ["intent", "memory", "extension", "llm", "post"]
+STAGE_INDEX: dict[str, int] = {name: i for i, name in enumerate(STAGE_NAMES)}
+STAGE_DESCRIPTIONS: dict[str, str] = {
+    "intent": "Classify user intent and select routing strategy",
+    "memory": "Retrieve relevant long-term memories",
+    "extension": "Execute any matching extensions",
+    "llm": "Generate response via LLM",
+    "post": "Post-process, store learnings, emit events",
+}
 
 PipelineStatus = Literal["idle", "active", "completed", "error"]
 StageStatus = Literal["pending", "active", "completed", "error", "skipped"]
 
-_pipelines: dict[str, dict[str, Any]] = {}
+# Only the most recent runs are kept; insertion order doubles as age, so the
+# oldest run is evicted with popitem(last=False) as soon as a new one starts.
+_MAX_PIPELINES = 50
 _active_request_id: str | None = None
 
+# Bumped on every registry mutation; /status uses it (plus a per-process token)
+# as its ETag so idle polling gets a bodyless 304.
+_registry_version: int = 0
+_ETAG_TOKEN = secrets.token_hex(4)
+
+
+def _touch() -> None:
+    global _registry_version
+    _registry_version += 1
+
 
 def _empty_stages() -> dict[str, dict[str, Any]]:
-    return {name: {"status": "pending", "started_at": None, "duration_ms": None, "detail": ""} for name in STAGE_NAMES}
+    # Only "status" is always present; started_at / duration_ms / detail are
+    # added once known, so polled /status payloads don't carry rows of nulls.
+    return {name: {"status": "pending"} for name in STAGE_NAMES}
+
+
+@dataclass(slots=True)
+class PipelineRun:
+    """State of one pipeline run in the registry."""
+
+    request_id: str
+    started_at: str
+    status: PipelineStatus = "active"
+    finished_at: str | None = None
+    current_stage: str = STAGE_NAMES[0]
+    stages: dict[str, dict[str, Any]] = field(default_factory=_empty_stages)
+    error: str | None = None
+
+    def to_summary(self) -> dict[str, Any]:
+        """Shape used by /history — everything except the per-stage detail."""
+        return {
+            "request_id": self.request_id,
+            "status": self.status,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "current_stage": self.current_stage,
+            "error": self.error,
+        }
+
+
+_pipelines: OrderedDict[str, PipelineRun] = OrderedDict()
 
 
 def start_pipeline(request_id: str | None = None) -> str:
@@ -47,16 +101,11 @@ def start_pipeline(request_id: str | None = None) -> str:
     """
     global _active_request_id
     rid = request_id or f"req_{uuid.uuid4().hex[:8]}"
-    _pipelines[rid] = {
-        "request_id": rid,
-        "status": "active",
-        "started_at": datetime.now().isoformat(),
-        "finished_at": None,
-        "current_stage": STAGE_NAMES[0],
-        "stages": _empty_stages(),
-        "error": None,
-    }
+    _pipelines[rid] = PipelineRun(request_id=rid, started_at=datetime.now().isoformat())
+    if len(_pipelines) > _MAX_PIPELINES:
+        _pipelines.popitem(last=False)
     _active_request_id = rid
+    _touch()
     return rid
 
 
@@ -75,31 +124,34 @@ def update_stage(
     if pipeline is None:
         logger.warning(f"update_stage called for unknown request_id={request_id}")
         return
-    if stage not in pipeline["stages"]:
+    stages = pipeline.stages
+    if stage not in stages:
         logger.warning(f"update_stage: unknown stage '{stage}' for request_id={request_id}")
         return
 
-    pipeline["stages"][stage].update(
-        {
-            "status": status,
-            "detail": detail,
-            "duration_ms": duration_ms,
-        }
-    )
+    entry = stages[stage]
+    entry["status"] = status
+    if detail:
+        entry["detail"] = detail
+    else:
+        entry.pop("detail", None)
+    if duration_ms is not None:
+        entry["duration_ms"] = duration_ms
+    else:
+        entry.pop("duration_ms", None)
+    _touch()
 
     if status == "active":
-        pipeline["stages"][stage]["started_at"] = datetime.now().isoformat()
-        pipeline["current_stage"] = stage
+        entry["started_at"] = datetime.now().isoformat()
+        pipeline.current_stage = stage
     elif status in ("completed", "error", "skipped"):
         # Advance current_stage pointer to the next pending stage
-        try:
-            idx = STAGE_NAMES.index(stage)
+        idx = STAGE_INDEX.get(stage)
+        if idx is not None:
             for next_stage in STAGE_NAMES[idx + 1 :]:
-                if pipeline["stages"][next_stage]["status"] == "pending":
-                    pipeline["current_stage"] = next_stage
+                if stages[next_stage]["status"] == "pending":
+                    pipeline.current_stage = next_stage
                     break
-        except (ValueError, IndexError):
-            pass
 
 
 def finish_pipeline(request_id: str, error: str | None = None) -> None:
@@ -107,17 +159,13 @@ def finish_pipeline(request_id: str, error: str | None = None) -> None:
     pipeline = _pipelines.get(request_id)
     if pipeline is None:
         return
-    pipeline["status"] = "error" if error else "completed"
-    pipeline["finished_at"] = datetime.now().isoformat()
-    pipeline["error"] = error
-
-    # Keep only the last 50 pipelines in memory
-    while len(_pipelines) > 50:
-        oldest = next(iter(_pipelines))
-        del _pipelines[oldest]
+    pipeline.status = "error" if error else "completed"
+    pipeline.finished_at = datetime.now().isoformat()
+    pipeline.error = error
+    _touch()
 
 
-def get_active_pipeline() -> dict[str, Any] | None:
+def get_active_pipeline() -> PipelineRun | None:
     """Return the most recently started pipeline, or None if no runs yet."""
     if _active_request_id and _active_request_id in _pipelines:
         return _pipelines[_active_request_id]
@@ -133,15 +181,20 @@ def get_active_pipeline() -> dict[str, Any] | None:
 
 @router.get(
     "/status",
-    response_model=dict[str, Any],
+    response_model=None,
     summary="Get current pipeline status",
     description="Returns the state of the most recently active processing pipeline.",
 )
-async def get_processing_status() -> dict[str, Any]:
+async def get_processing_status(request: Request, response: Response) -> dict[str, Any] | Response:
     """
     Return the latest pipeline run.  If no run has started yet the response
     will indicate an idle state — never fake/hardcoded data.
     """
+    etag = f'W/"{_ETAG_TOKEN}-{_registry_version}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+
     try:
         pipeline = get_active_pipeline()
 
@@ -156,19 +209,29 @@ async def get_processing_status() -> dict[str, Any]:
             }
 
         return {
-            "status": pipeline["status"],
-            "request_id": pipeline["request_id"],
-            "started_at": pipeline["started_at"],
-            "finished_at": pipeline.get("finished_at"),
-            "current_stage": pipeline["current_stage"],
-            "stages": pipeline["stages"],
-            "error": pipeline.get("error"),
+            "status": pipeline.status,
+            "request_id": pipeline.request_id,
+            "started_at": pipeline.started_at,
+            "finished_at": pipeline.finished_at,
+            "current_stage": pipeline.current_stage,
+            "stages": pipeline.stages,
+            "error": pipeline.error,
         }
     except Exception as e:
         logger.error(f"Get processing status error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Response for /stages before any run has started — nothing in it varies.
+_IDLE_STAGES_VIEW: dict[str, Any] = {
+    "stages": STAGE_NAMES,
+    "stage_count": len(STAGE_NAMES),
+    "details": {
+        name: {"description": description, "status": "pending"} for name, description in STAGE_DESCRIPTIONS.items()
+    },
+}
+
+
 @router.get(
     "/stages",
     response_model=dict[str, Any],
@@ -178,30 +241,17 @@ async def get_processing_status() -> dict[str, Any]:
 async def get_pipeline_stages() -> dict[str, Any]:
     """Return metadata about each pipeline stage."""
     try:
-        stage_descriptions = {
-            "intent": "Classify user intent and select routing strategy",
-            "memory": "Retrieve relevant long-term memories",
-            "extension": "Execute any matching extensions",
-            "llm": "Generate response via LLM",
-            "post": "Post-process, store learnings, emit events",
-        }
-
         pipeline = get_active_pipeline()
-        current_statuses = (
-            {name: pipeline["stages"][name]["status"] for name in STAGE_NAMES}
-            if pipeline
-            else {name: "pending" for name in STAGE_NAMES}
-        )
+        if pipeline is None:
+            return _IDLE_STAGES_VIEW
 
+        stages = pipeline.stages
         return {
             "stages": STAGE_NAMES,
             "stage_count": len(STAGE_NAMES),
             "details": {
-                name: {
-                    "description": stage_descriptions.get(name, ""),
-                    "status": current_statuses.get(name, "pending"),
-                }
-                for name in STAGE_NAMES
+                name: {"description": description, "status": stages[name]["status"]}
+                for name, description in STAGE_DESCRIPTIONS.items()
             },
         }
     except Exception as e:
@@ -211,31 +261,23 @@ async def get_pipeline_stages() -> dict[str, Any]:
 
 @router.get(
     "/history",
-    response_model=dict[str, Any],
+    response_model=None,
     summary="Get recent pipeline runs",
     description="Returns the last N pipeline runs (up to 50 kept in memory).",
 )
-async def get_pipeline_history(limit: int = 10) -> dict[str, Any]:
+async def get_pipeline_history(limit: int = 10) -> ORJSONResponse:
     """Return recent pipeline runs for diagnostics."""
     try:
-        limit = max(1, min(limit, 50))
-        recent = list(reversed(list(_pipelines.values())))[:limit]
-
-        return {
-            "runs": [
-                {
-                    "request_id": p["request_id"],
-                    "status": p["status"],
-                    "started_at": p["started_at"],
-                    "finished_at": p.get("finished_at"),
-                    "current_stage": p["current_stage"],
-                    "error": p.get("error"),
-                }
-                for p in recent
-            ],
-            "total_recorded": len(_pipelines),
-            "limit": limit,
-        }
+        limit = max(1, min(limit, _MAX_PIPELINES))
+        recent = islice(reversed(_pipelines.values()), limit)
+
+        return ORJSONResponse(
+            {
+                "runs": [run.to_summary() for run in recent],
+                "total_recorded": len(_pipelines),
+                "limit": limit,
+            }
+        )
     except Exception as e:
         logger.error(f"Get pipeline history error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,29 +7,54 @@
 path in both development and production (PyInstaller) environments.
 """
 
-from typing import Any, Optional
+import asyncio
+from operator import attrgetter
+from typing import Annotated, Any, Callable, Optional
 
 import httpx
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
-from src.config.settings import get_config_path, get_settings, reload_settings
+from src.config.settings import Settings, get_config_path, get_settings
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/settings", tags=["Settings"])
 
+# String form of the active config path, resolved once at import and fixed for the
+# life of the process (these routes never call reload_settings())
+_config_path_str: str = str(get_config_path())
+
+# Per-section GET payloads; settings only change through _schedule_persist, which clears this
+_response_cache: dict[str, dict[str, Any]] = {}
+
+# Serialized /all body, rebuilt lazily after each _schedule_persist
+_all_settings_json: Optional[bytes] = None
+
+# Debounced settings.yaml writes: the flush waits until no update has arrived for
+# the window, so a burst of updates shares one write
+_PERSIST_DEBOUNCE_S = 0.2
+_pending_settings: Optional[Settings] = None
+_last_update_at: float = 0.0
+_flush_task: Optional[asyncio.Task] = None
+
 
 # ---------------------------------------------------------------------------
 # Request models
 # ---------------------------------------------------------------------------
 
+# Shared constrained types so identical field schemas are built once
+_PositiveInt = Annotated[Optional[int], Field(ge=1)]
+_NonNegativeInt = Annotated[Optional[int], Field(ge=0)]
+_Fraction = Annotated[Optional[float], Field(ge=0.0, le=1.0)]
+
 
 class LLMSettingsRequest(BaseModel):
     """Partial update for LLM settings."""
 
     provider: Optional[str] = Field(None, description="LLM provider (e.g., ollama)")
     base_url: Optional[str] = Field(None, description="Provider base URL")
-    timeout: Optional[int] = Field(None, ge=1, description="Request timeout in seconds")
+    timeout: _PositiveInt = Field(None, description="Request timeout in seconds")
     # Named model slots
     fast: Optional[str] = Field(None, description="Fast-response model name")
     critical: Optional[str] = Field(None, description="Critical/thinking model name")
@@ -41,11 +66,11 @@ class MemorySettingsRequest(BaseModel):
     """Partial update for memory settings."""
 
     provider: Optional[str] = Field(None, description="Memory provider (e.g., mem0)")
-    short_term_max_messages: Optional[int] = Field(None, ge=1, description="Max messages in short-term buffer")
-    short_term_expire_after: Optional[int] = Field(None, ge=0, description="Short-term expiry in seconds")
+    short_term_max_messages: _PositiveInt = Field(None, description="Max messages in short-term buffer")
+    short_term_expire_after: _NonNegativeInt = Field(None, description="Short-term expiry in seconds")
     long_term_auto_extract: Optional[bool] = Field(None, description="Auto-extract learnings")
-    long_term_extract_interval: Optional[int] = Field(None, ge=1, description="Extract interval (messages)")
-    retrieval_threshold: Optional[float] = Field(None, ge=0.0, le=1.0, description="Min similarity threshold")
+    long_term_extract_interval: _PositiveInt = Field(None, description="Extract interval (messages)")
+    retrieval_threshold: _Fraction = Field(None, description="Min similarity threshold")
     retrieval_max_results: Optional[int] = Field(None, ge=1, le=100, description="Max retrieval results")
     retrieval_reranking: Optional[bool] = Field(None, description="Enable retrieval reranking")
     embeddings_model: Optional[str] = Field(None, description="Embedding model name")
@@ -56,9 +81,7 @@ class MemorySettingsRequest(BaseModel):
         None, description="Require approval for inferred fragments"
     )
     personality_auto_approve_enabled: Optional[bool] = Field(None, description="Enable auto-approval")
-    personality_auto_approve_threshold: Optional[float] = Field(
-        None, ge=0.0, le=1.0, description="Auto-approve confidence threshold"
-    )
+    personality_auto_approve_threshold: _Fraction = Field(None, description="Auto-approve confidence threshold")
     personality_learning_mode: Optional[str] = Field(
         None, description="Learning mode: conservative | moderate | aggressive"
     )
@@ -86,8 +109,8 @@ class TelemetrySettingsRequest(BaseModel):
     """Partial update for telemetry settings."""
 
     enabled: Optional[bool] = Field(None, description="Enable telemetry collection")
-    collect_interval: Optional[int] = Field(None, ge=1, description="Metrics collection interval (seconds)")
-    retention_days: Optional[int] = Field(None, ge=1, description="Metrics retention period (days)")
+    collect_interval: _PositiveInt = Field(None, description="Metrics collection interval (seconds)")
+    retention_days: _PositiveInt = Field(None, description="Metrics retention period (days)")
     track_response_times: Optional[bool] = Field(None)
     track_memory_usage: Optional[bool] = Field(None)
     track_extension_performance: Optional[bool] = Field(None)
@@ -104,12 +127,246 @@ class UISettingsRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-def _persist(settings) -> str:
-    """Save settings to the correct config file and bust the cache."""
-    path = get_config_path()
-    settings.to_yaml(path)
-    reload_settings()
-    return str(path)
+async def _current_settings() -> Settings:
+    """Dependency returning the cached Settings instance.
+
+    Declared async so FastAPI resolves it inline rather than in the threadpool.
+    """
+    return get_settings()
+
+
+def _schedule_persist(settings: Settings) -> str:
+    """Bust the response caches and queue a debounced write of *settings*.
+
+    Handlers mutate the cached Settings instance in place, so reads see the
+    change immediately; the YAML write is coalesced by _flush_settings.
+    """
+    global _all_settings_json, _pending_settings, _last_update_at, _flush_task
+    _response_cache.clear()
+    _all_settings_json = None
+    _pending_settings = settings
+    _last_update_at = asyncio.get_running_loop().time()
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_settings())
+    return _config_path_str
+
+
+async def _flush_settings() -> None:
+    """Write pending settings once no update has arrived for _PERSIST_DEBOUNCE_S."""
+    global _pending_settings
+    loop = asyncio.get_running_loop()
+    while _pending_settings is not None:
+        # Each update pushes the deadline back, so the timer restarts on every call
+        while (delay := _last_update_at + _PERSIST_DEBOUNCE_S - loop.time()) > 0:
+            await asyncio.sleep(delay)
+        settings, _pending_settings = _pending_settings, None
+        try:
+            await asyncio.to_thread(settings.to_yaml, get_config_path())
+        except Exception as e:
+            logger.error(f"Failed to save settings to {_config_path_str}: {e}", exc_info=True)
+
+
+async def flush_pending_settings() -> None:
+    """Wait for any queued settings write to land (called on shutdown)."""
+    if _flush_task is not None and not _flush_task.done():
+        await _flush_task
+
+
+# ---------------------------------------------------------------------------
+# Field maps — request field name -> (getter for the owning config object, attribute)
+# ---------------------------------------------------------------------------
+
+_FieldMap = dict[str, tuple[Callable[[Settings], Any], str]]
+
+
+def _field_map(fields: dict[str, str]) -> _FieldMap:
+    """Split dotted target paths into a precompiled getter and the final attribute name."""
+    compiled: _FieldMap = {}
+    for name, target in fields.items():
+        owner, attr = target.rsplit(".", 1)
+        compiled[name] = (attrgetter(owner), attr)
+    return compiled
+
+
+_LLM_MODEL_SLOTS = ("fast", "critical", "code", "router")
+
+_LLM_FIELDS = _field_map(
+    {
+        "provider": "llm.provider",
+        "base_url": "llm.base_url",
+        "timeout": "llm.timeout",
+    }
+)
+
+_MEMORY_FIELDS = _field_map(
+    {
+        "provider": "memory.provider",
+        "embeddings_model": "memory.embeddings.model",
+        "short_term_max_messages": "memory.short_term.max_messages",
+        "short_term_expire_after": "memory.short_term.expire_after",
+        "long_term_auto_extract": "memory.long_term.auto_extract",
+        "long_term_extract_interval": "memory.long_term.extract_interval",
+        "retrieval_threshold": "memory.retrieval.dynamic_threshold",
+        "retrieval_max_results": "memory.retrieval.max_results",
+        "retrieval_reranking": "memory.retrieval.reranking",
+        # Personality fields
+        "personality_inferential_learning_enabled": "memory.personality.inferential_learning_enabled",
+        "personality_inferential_learning_requires_approval": (
+            "memory.personality.inferential_learning_requires_approval"
+        ),
+        "personality_auto_approve_enabled": "memory.personality.auto_approve_enabled",
+        "personality_auto_approve_threshold": "memory.personality.auto_approve_threshold",
+        "personality_learning_mode": "memory.personality.learning_mode",
+        "personality_token_budget": "memory.personality.personality_token_budget",
+        "personality_max_fragments_in_prompt": "memory.personality.max_fragments_in_prompt",
+        "personality_compress_threshold": "memory.personality.compress_threshold",
+    }
+)
+
+_LOGGING_FIELDS = _field_map(
+    {
+        "level": "logging.level",
+        "database_level": "logging.database_level",
+        "file_enabled": "logging.file.enabled",
+        "session_enabled": "logging.session.enabled",
+    }
+)
+
+_TELEMETRY_FIELDS = _field_map(
+    {
+        "enabled": "telemetry.enabled",
+        "collect_interval": "telemetry.metrics.collect_interval",
+        "retention_days": "telemetry.metrics.retention_days",
+        "track_response_times": "telemetry.performance.track_response_times",
+        "track_memory_usage": "telemetry.performance.track_memory_usage",
+        "track_extension_performance": "telemetry.performance.track_extension_performance",
+    }
+)
+
+_UI_FIELDS = _field_map({"auto_open_browser": "ui.auto_open_browser"})
+
+
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+def _normalize_level(level: str) -> Optional[str]:
+    """Return *level* as a valid upper-case log level name, or None if it is not one."""
+    if level in _VALID_LEVELS:
+        return level
+    level = level.upper()
+    return level if level in _VALID_LEVELS else None
+
+
+def _apply_updates(s: Settings, updates: dict[str, Any], fields: _FieldMap) -> None:
+    """Assign each provided request field onto its target in *s*."""
+    for name, value in updates.items():
+        owner, attr = fields[name]
+        setattr(owner(s), attr, value)
+
+
+# ---------------------------------------------------------------------------
+# Section builders — shape the GET payload for each settings section
+# ---------------------------------------------------------------------------
+
+
+def _build_llm(s: Settings) -> dict[str, Any]:
+    models = {slot: (cfg.name if cfg else None) for slot, cfg in s.llm.models.items()}
+    return {
+        "provider": s.llm.provider,
+        "base_url": s.llm.base_url,
+        "timeout": s.llm.timeout,
+        "models": models,
+    }
+
+
+def _build_memory(s: Settings) -> dict[str, Any]:
+    m = s.memory
+    p = m.personality
+    return {
+        "provider": m.provider,
+        "embeddings_model": m.embeddings.model,
+        "short_term": {
+            "max_messages": m.short_term.max_messages,
+            "expire_after": m.short_term.expire_after,
+        },
+        "long_term": {
+            "auto_extract": m.long_term.auto_extract,
+            "extract_interval": m.long_term.extract_interval,
+        },
+        "retrieval": {
+            "dynamic_threshold": m.retrieval.dynamic_threshold,
+            "max_results": m.retrieval.max_results,
+            "reranking": m.retrieval.reranking,
+        },
+        "personality": {
+            "inferential_learning_enabled": p.inferential_learning_enabled,
+            "inferential_learning_requires_approval": p.inferential_learning_requires_approval,
+            "auto_approve_enabled": p.auto_approve_enabled,
+            "auto_approve_threshold": p.auto_approve_threshold,
+            "learning_mode": p.learning_mode,
+            "personality_token_budget": p.personality_token_budget,
+            "max_fragments_in_prompt": p.max_fragments_in_prompt,
+            "compress_threshold": p.compress_threshold,
+        },
+    }
+
+
+def _build_logging(s: Settings) -> dict[str, Any]:
+    lg = s.logging
+    return {
+        "level": lg.level,
+        "database_level": lg.database_level,
+        "file": {
+            "enabled": lg.file.enabled,
+            "path": lg.file.path,
+        },
+        "session": {
+            "enabled": lg.session.enabled,
+            "path": lg.session.path,
+        },
+    }
+
+
+def _build_telemetry(s: Settings) -> dict[str, Any]:
+    t = s.telemetry
+    return {
+        "enabled": t.enabled,
+        "metrics": {
+            "collect_interval": t.metrics.collect_interval,
+            "retention_days": t.metrics.retention_days,
+        },
+        "performance": {
+            "track_response_times": t.performance.track_response_times,
+            "track_memory_usage": t.performance.track_memory_usage,
+            "track_extension_performance": t.performance.track_extension_performance,
+        },
+    }
+
+
+def _build_ui(s: Settings) -> dict[str, Any]:
+    return {
+        "behind_the_sena_port": s.ui.behind_the_sena_port,
+        "sena_app_port": s.ui.sena_app_port,
+        "auto_open_browser": s.ui.auto_open_browser,
+    }
+
+
+_SECTION_BUILDERS: dict[str, Callable[[Settings], dict[str, Any]]] = {
+    "llm": _build_llm,
+    "memory": _build_memory,
+    "logging": _build_logging,
+    "telemetry": _build_telemetry,
+    "ui": _build_ui,
+}
+
+
+def _section_response(name: str, s: Settings) -> dict[str, Any]:
+    """Return the cached GET payload for a section, building it on first use."""
+    cached = _response_cache.get(name)
+    if cached is None:
+        cached = {"status": "success", "data": _SECTION_BUILDERS[name](s)}
+        _response_cache[name] = cached
+    return cached
 
 
 # ---------------------------------------------------------------------------
@@ -118,73 +375,39 @@ def _persist(settings) -> str:
 
 
 @router.get(
-    "/llm",
+    "/section/{name}",
     response_model=dict[str, Any],
-    summary="Get LLM settings",
-    description="Returns the current LLM provider, base URL, and model assignments",
+    summary="Get settings for a section",
+    description="Returns the current values for one section: llm, memory, logging, telemetry, or ui",
 )
-async def get_llm_settings() -> dict[str, Any]:
+async def get_section_settings(name: str, s: Settings = Depends(_current_settings)) -> dict[str, Any]:
+    if name not in _SECTION_BUILDERS:
+        raise HTTPException(status_code=404, detail=f"Unknown settings section '{name}'")
     try:
-        s = get_settings()
-        models = {slot: (cfg.name if cfg else None) for slot, cfg in s.llm.models.items()}
-        return {
-            "status": "success",
-            "data": {
-                "provider": s.llm.provider,
-                "base_url": s.llm.base_url,
-                "timeout": s.llm.timeout,
-                "models": models,
-            },
-        }
+        return _section_response(name, s)
     except Exception as e:
-        logger.error(f"Get LLM settings error: {e}", exc_info=True)
+        logger.error(f"Get {name} settings error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/llm",
+    response_model=dict[str, Any],
+    summary="Get LLM settings",
+    description="Returns the current LLM provider, base URL, and model assignments",
+)
+async def get_llm_settings(s: Settings = Depends(_current_settings)) -> dict[str, Any]:
+    return await get_section_settings("llm", s)
+
+
 @router.get(
     "/memory",
     response_model=dict[str, Any],
     summary="Get memory settings",
     description="Returns the current memory configuration",
 )
-async def get_memory_settings() -> dict[str, Any]:
-    try:
-        s = get_settings()
-        m = s.memory
-        p = m.personality
-        return {
-            "status": "success",
-            "data": {
-                "provider": m.provider,
-                "embeddings_model": m.embeddings.model,
-                "short_term": {
-                    "max_messages": m.short_term.max_messages,
-                    "expire_after": m.short_term.expire_after,
-                },
-                "long_term": {
-                    "auto_extract": m.long_term.auto_extract,
-                    "extract_interval": m.long_term.extract_interval,
-                },
-                "retrieval": {
-                    "dynamic_threshold": m.retrieval.dynamic_threshold,
-                    "max_results": m.retrieval.max_results,
-                    "reranking": m.retrieval.reranking,
-                },
-                "personality": {
-                    "inferential_learning_enabled": p.inferential_learning_enabled,
-                    "inferential_learning_requires_approval": p.inferential_learning_requires_approval,
-                    "auto_approve_enabled": p.auto_approve_enabled,
-                    "auto_approve_threshold": p.auto_approve_threshold,
-                    "learning_mode": p.learning_mode,
-                    "personality_token_budget": p.personality_token_budget,
-                    "max_fragments_in_prompt": p.max_fragments_in_prompt,
-                    "compress_threshold": p.compress_threshold,
-                },
-            },
-        }
-    except Exception as e:
-        logger.error(f"Get memory settings error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_memory_settings(s: Settings = Depends(_current_settings)) -> dict[str, Any]:
+    return await get_section_settings("memory", s)
 
 
 @router.get(
@@ -193,28 +416,8 @@ async def get_memory_settings() -> dict[str, Any]:
     summary="Get logging settings",
     description="Returns the current logging configuration",
 )
-async def get_logging_settings() -> dict[str, Any]:
-    try:
-        s = get_settings()
-        lg = s.logging
-        return {
-            "status": "success",
-            "data": {
-                "level": lg.level,
-                "database_level": lg.database_level,
-                "file": {
-                    "enabled": lg.file.enabled,
-                    "path": lg.file.path,
-                },
-                "session": {
-                    "enabled": lg.session.enabled,
-                    "path": lg.session.path,
-                },
-            },
-        }
-    except Exception as e:
-        logger.error(f"Get logging settings error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_logging_settings(s: Settings = Depends(_current_settings)) -> dict[str, Any]:
+    return await get_section_settings("logging", s)
 
 
 @router.get(
@@ -223,28 +426,8 @@ async def get_logging_settings() -> dict[str, Any]:
     summary="Get telemetry settings",
     description="Returns the current telemetry configuration",
 )
-async def get_telemetry_settings() -> dict[str, Any]:
-    try:
-        s = get_settings()
-        t = s.telemetry
-        return {
-            "status": "success",
-            "data": {
-                "enabled": t.enabled,
-                "metrics": {
-                    "collect_interval": t.metrics.collect_interval,
-                    "retention_days": t.metrics.retention_days,
-                },
-                "performance": {
-                    "track_response_times": t.performance.track_response_times,
-                    "track_memory_usage": t.performance.track_memory_usage,
-                    "track_extension_performance": t.performance.track_extension_performance,
-                },
-            },
-        }
-    except Exception as e:
-        logger.error(f"Get telemetry settings error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_telemetry_settings(s: Settings = Depends(_current_settings)) -> dict[str, Any]:
+    return await get_section_settings("telemetry", s)
 
 
 @router.get(
@@ -253,36 +436,28 @@ async def get_telemetry_settings() -> dict[str, Any]:
     summary="Get UI settings",
     description="Returns the current UI configuration",
 )
-async def get_ui_settings() -> dict[str, Any]:
-    try:
-        s = get_settings()
-        return {
-            "status": "success",
-            "data": {
-                "behind_the_sena_port": s.ui.behind_the_sena_port,
-                "sena_app_port": s.ui.sena_app_port,
-                "auto_open_browser": s.ui.auto_open_browser,
-            },
-        }
-    except Exception as e:
-        logger.error(f"Get UI settings error: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+async def get_ui_settings(s: Settings = Depends(_current_settings)) -> dict[str, Any]:
+    return await get_section_settings("ui", s)
 
 
 @router.get(
     "/all",
-    response_model=dict[str, Any],
+    response_model=None,
     summary="Get all settings",
     description="Returns the full settings dump (all sections)",
 )
-async def get_all_settings() -> dict[str, Any]:
+async def get_all_settings(s: Settings = Depends(_current_settings)) -> Response:
+    global _all_settings_json
     try:
-        s = get_settings()
-        return {
-            "status": "success",
-            "data": s.model_dump(),
-            "config_path": str(get_config_path()),
-        }
+        if _all_settings_json is None:
+            _all_settings_json = orjson.dumps(
+                {
+                    "status": "success",
+                    "data": s.model_dump(mode="json"),
+                    "config_path": _config_path_str,
+                }
+            )
+        return Response(content=_all_settings_json, media_type="application/json")
     except Exception as e:
         logger.error(f"Get all settings error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -299,28 +474,18 @@ async def get_all_settings() -> dict[str, Any]:
     summary="Update LLM settings",
     description="Updates LLM provider, base URL, timeout, and model assignments. Persists to settings.yaml.",
 )
-async def update_llm_settings(payload: LLMSettingsRequest) -> dict[str, Any]:
+async def update_llm_settings(payload: LLMSettingsRequest, s: Settings = Depends(_current_settings)) -> dict[str, Any]:
     try:
-        s = get_settings()
-
-        if payload.provider is not None:
-            s.llm.provider = payload.provider
-        if payload.base_url is not None:
-            s.llm.base_url = payload.base_url
-        if payload.timeout is not None:
-            s.llm.timeout = payload.timeout
+        updates = payload.model_dump(exclude_none=True)
         # Named model slots
-        for slot, value in {
-            "fast": payload.fast,
-            "critical": payload.critical,
-            "code": payload.code,
-            "router": payload.router,
-        }.items():
+        for slot in _LLM_MODEL_SLOTS:
+            value = updates.pop(slot, None)
             if value is not None and slot in s.llm.models:
                 s.llm.models[slot].name = value
+        _apply_updates(s, updates, _LLM_FIELDS)
 
-        saved_path = _persist(s)
-        logger.info(f"LLM settings updated and saved to {saved_path}")
+        saved_path = _schedule_persist(s)
+        logger.info(f"LLM settings updated and queued for save to {saved_path}")
 
         return {
             "status": "success",
@@ -338,51 +503,21 @@ async def update_llm_settings(payload: LLMSettingsRequest) -> dict[str, Any]:
     summary="Update memory settings",
     description="Updates memory configuration and persists to settings.yaml.",
 )
-async def update_memory_settings(payload: MemorySettingsRequest) -> dict[str, Any]:
+async def update_memory_settings(
+    payload: MemorySettingsRequest, s: Settings = Depends(_current_settings)
+) -> dict[str, Any]:
     try:
-        s = get_settings()
-        m = s.memory
-
-        if payload.provider is not None:
-            m.provider = payload.provider
-        if payload.embeddings_model is not None:
-            m.embeddings.model = payload.embeddings_model
-        if payload.short_term_max_messages is not None:
-            m.short_term.max_messages = payload.short_term_max_messages
-        if payload.short_term_expire_after is not None:
-            m.short_term.expire_after = payload.short_term_expire_after
-        if payload.long_term_auto_extract is not None:
-            m.long_term.auto_extract = payload.long_term_auto_extract
-        if payload.long_term_extract_interval is not None:
-            m.long_term.extract_interval = payload.long_term_extract_interval
-        if payload.retrieval_threshold is not None:
-            m.retrieval.dynamic_threshold = payload.retrieval_threshold
-        if payload.retrieval_max_results is not None:
-            m.retrieval.max_results = payload.retrieval_max_results
-        if payload.retrieval_reranking is not None:
-            m.retrieval.reranking = payload.retrieval_reranking
+        updates = payload.model_dump(exclude_none=True)
+        _apply_updates(s, updates, _MEMORY_FIELDS)
 
-        # Personality fields
-        p = m.personality
-        if payload.personality_inferential_learning_enabled is not None:
-            p.inferential_learning_enabled = payload.personality_inferential_learning_enabled
-        if payload.personality_inferential_learning_requires_approval is not None:
-            p.inferential_learning_requires_approval = payload.personality_inferential_learning_requires_approval
-        if payload.personality_auto_approve_enabled is not None:
-            p.auto_approve_enabled = payload.personality_auto_approve_enabled
-        if payload.personality_auto_approve_threshold is not None:
-            p.auto_approve_threshold = payload.personality_auto_approve_threshold
-        if payload.personality_learning_mode is not None:
-            p.learning_mode = payload.personality_learning_mode
-        if payload.personality_token_budget is not None:
-            p.personality_token_budget = payload.personality_token_budget
-        if payload.personality_max_fragments_in_prompt is not None:
-            p.max_fragments_in_prompt = payload.personality_max_fragments_in_prompt
-        if payload.personality_compress_threshold is not None:
-            p.compress_threshold = payload.personality_compress_threshold
-
-        saved_path = _persist(s)
-        logger.info(f"Memory settings updated and saved to {saved_path}")
+        # Budget, fragment cap and compression threshold shape the cached personality block
+        if any(name.startswith("personality_") for name in updates):
+            from src.memory.personality import PersonalityManager
+
+            PersonalityManager.get_instance().invalidate_cache()
+
+        saved_path = _schedule_persist(s)
+        logger.info(f"Memory settings updated and queued for save to {saved_path}")
 
         return {
             "status": "success",
@@ -400,35 +535,32 @@ async def update_memory_settings(payload: MemorySettingsRequest) -> dict[str, An
     summary="Update logging settings",
     description="Updates logging configuration and persists to settings.yaml.",
 )
-async def update_logging_settings(payload: LoggingSettingsRequest) -> dict[str, Any]:
+async def update_logging_settings(
+    payload: LoggingSettingsRequest, s: Settings = Depends(_current_settings)
+) -> dict[str, Any]:
     try:
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        s = get_settings()
-        lg = s.logging
+        updates = payload.model_dump(exclude_none=True)
 
-        if payload.level is not None:
-            level = payload.level.upper()
-            if level not in valid_levels:
+        if "level" in updates:
+            level = _normalize_level(updates["level"])
+            if level is None:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Invalid log level '{payload.level}'. Must be one of: {sorted(valid_levels)}",
+                    detail=f"Invalid log level '{payload.level}'. Must be one of: {sorted(_VALID_LEVELS)}",
                 )
-            lg.level = level
-        if payload.database_level is not None:
-            db_level = payload.database_level.upper()
-            if db_level not in valid_levels:
+            updates["level"] = level
+        if "database_level" in updates:
+            db_level = _normalize_level(updates["database_level"])
+            if db_level is None:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Invalid database log level '{payload.database_level}'.",
                 )
-            lg.database_level = db_level
-        if payload.file_enabled is not None:
-            lg.file.enabled = payload.file_enabled
-        if payload.session_enabled is not None:
-            lg.session.enabled = payload.session_enabled
+            updates["database_level"] = db_level
+        _apply_updates(s, updates, _LOGGING_FIELDS)
 
-        saved_path = _persist(s)
-        logger.info(f"Logging settings updated and saved to {saved_path}")
+        saved_path = _schedule_persist(s)
+        logger.info(f"Logging settings updated and queued for save to {saved_path}")
 
         return {
             "status": "success",
@@ -448,26 +580,14 @@ async def update_logging_settings(payload: LoggingSettingsRequest) -> dict[str,
     summary="Update telemetry settings",
     description="Updates telemetry configuration and persists to settings.yaml.",
 )
-async def update_telemetry_settings(payload: TelemetrySettingsRequest) -> dict[str, Any]:
+async def update_telemetry_settings(
+    payload: TelemetrySettingsRequest, s: Settings = Depends(_current_settings)
+) -> dict[str, Any]:
     try:
-        s = get_settings()
-        t = s.telemetry
-
-        if payload.enabled is not None:
-            t.enabled = payload.enabled
-        if payload.collect_interval is not None:
-            t.metrics.collect_interval = payload.collect_interval
-        if payload.retention_days is not None:
-            t.metrics.retention_days = payload.retention_days
-        if payload.track_response_times is not None:
-            t.performance.track_response_times = payload.track_response_times
-        if payload.track_memory_usage is not None:
-            t.performance.track_memory_usage = payload.track_memory_usage
-        if payload.track_extension_performance is not None:
-            t.performance.track_extension_performance = payload.track_extension_performance
-
-        saved_path = _persist(s)
-        logger.info(f"Telemetry settings updated and saved to {saved_path}")
+        _apply_updates(s, payload.model_dump(exclude_none=True), _TELEMETRY_FIELDS)
+
+        saved_path = _schedule_persist(s)
+        logger.info(f"Telemetry settings updated and queued for save to {saved_path}")
 
         return {
             "status": "success",
@@ -485,15 +605,12 @@ async def update_telemetry_settings(payload: TelemetrySettingsRequest) -> dict[s
     summary="Update UI settings",
     description="Updates UI configuration and persists to settings.yaml.",
 )
-async def update_ui_settings(payload: UISettingsRequest) -> dict[str, Any]:
+async def update_ui_settings(payload: UISettingsRequest, s: Settings = Depends(_current_settings)) -> dict[str, Any]:
     try:
-        s = get_settings()
-
-        if payload.auto_open_browser is not None:
-            s.ui.auto_open_browser = payload.auto_open_browser
+        _apply_updates(s, payload.model_dump(exclude_none=True), _UI_FIELDS)
 
-        saved_path = _persist(s)
-        logger.info(f"UI settings updated and saved to {saved_path}")
+        saved_path = _schedule_persist(s)
+        logger.info(f"UI settings updated and queued for save to {saved_path}")
 
         return {
             "status": "success",
@@ -518,18 +635,17 @@ async def update_ui_settings(payload: UISettingsRequest) -> dict[str, Any]:
     summary="List available Ollama models",
     description="Fetches available models from the configured Ollama instance. Requires Ollama to be running.",
 )
-async def list_ollama_models() -> dict[str, Any]:
+async def list_ollama_models(request: Request, s: Settings = Depends(_current_settings)) -> dict[str, Any]:
     """
     @RequiresInternet: Ollama API (localhost by default, but may be remote)
     @Graceful: Returns 502 with a user-friendly message if unreachable
     """
     try:
-        s = get_settings()
         base_url = s.llm.base_url.rstrip("/")
 
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{base_url}/api/tags")
-            response.raise_for_status()
+        client: httpx.AsyncClient = request.app.state.ollama_client
+        response = await client.get(f"{base_url}/api/tags", timeout=5.0)
+        response.raise_for_status()
 
         models = response.json().get("models", [])
         names = [m.get("name") for m in models if isinstance(m, dict) and m.get("name")]
@@ -564,18 +680,17 @@ async def list_ollama_models() -> dict[str, Any]:
     summary="Check Ollama connectivity",
     description="Pings the configured Ollama instance to verify it is reachable.",
 )
-async def check_ollama_health() -> dict[str, Any]:
+async def check_ollama_health(request: Request, s: Settings = Depends(_current_settings)) -> dict[str, Any]:
     """
     @RequiresInternet: Ollama API
     @Graceful: Returns connected=false with reason if unreachable
     """
     try:
-        s = get_settings()
         base_url = s.llm.base_url.rstrip("/")
 
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            response = await client.get(f"{base_url}/api/tags")
-            reachable = response.status_code == 200
+        client: httpx.AsyncClient = request.app.state.ollama_client
+        response = await client.get(f"{base_url}/api/tags", timeout=3.0)
+        reachable = response.status_code == 200
 
         return {
             "status": "success",
@@ -583,7 +698,6 @@ async def check_ollama_health() -> dict[str, Any]:
             "base_url": base_url,
         }
     except (httpx.ConnectError, httpx.TimeoutException) as e:
-        s = get_settings()
         return {
             "status": "success",
             "connected": False,
@@ -13,18 +13,19 @@
 import os
 import sys
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator
 
+import httpx
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from src.api.deps import get_sena, shutdown_sena
-from src.api.models.responses import HealthResponse
+from src.api.models.responses import HealthResponse, ORJSONResponse
 from src.api.routes import (
     chat_router,
     debug_router,
@@ -36,6 +37,8 @@
     settings_router,
     telemetry_router,
 )
+from src.api.routes.chat import drain_background_tasks
+from src.api.routes.settings import flush_pending_settings
 from src.api.websocket.manager import ws_manager
 from src.config.settings import get_app_data_dir, get_settings
 from src.core.runtime import RUNTIME_ID, get_runtime_info
@@ -74,6 +77,15 @@ def llm_settings_complete() -> bool:
 )
 
 
+async def _bootstrap_sena() -> None:
+    """Initialize Sena in the background so startup doesn't block on Ollama/model warmup."""
+    try:
+        await get_sena()
+        logger.info("Sena initialized for API server")
+    except Exception as e:
+        logger.error(f"Failed to initialize Sena: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler."""
@@ -83,21 +95,36 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info(f"Runtime ID: {RUNTIME_ID}")
     logger.info("=" * 60)
 
-    # Initialize Sena (only when LLM settings are complete)
-    try:
-        if llm_settings_complete():
-            sena = await get_sena()
-            logger.info("Sena initialized for API server")
-        else:
-            logger.info("Skipping Sena initialization: LLM settings incomplete")
-    except Exception as e:
-        logger.error(f"Failed to initialize Sena: {e}")
+    # Initialize Sena (only when LLM settings are complete). Runs as a
+    # background task — early requests wait on the in-flight init via get_sena().
+    bootstrap_task: asyncio.Task | None = None
+    if llm_settings_complete():
+        bootstrap_task = asyncio.create_task(_bootstrap_sena())
+    else:
+        logger.info("Skipping Sena initialization: LLM settings incomplete")
+
+    # Personality routes resolve their manager from a cached global; initializing
+    # it here keeps the DB/repository wiring out of the first request.
+    from src.memory.personality import PersonalityManager
+
+    if not await PersonalityManager.get_instance().initialize():
+        logger.warning("PersonalityManager startup init failed; routes will retry lazily")
+
+    # Shared pooled client for the settings routes' Ollama probes
+    app.state.ollama_client = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_keepalive_connections=4))
 
     yield
 
     # Shutdown
     logger.info("Shutting down Sena API server...")
+    if bootstrap_task is not None and not bootstrap_task.done():
+        bootstrap_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await bootstrap_task
+    await drain_background_tasks()
     await shutdown_sena()
+    await flush_pending_settings()
+    await app.state.ollama_client.aclose()
     logger.info("Sena API server shutdown complete")
 
 
@@ -106,6 +133,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     description="Self-Evolving AI Assistant API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -0,0 +1,4 @@
+import sys
+from pathlib import Path
+ROOT = Path(__file__).parents[3]  # repo root
+sys.path.insert(0, str(ROOT))
\ No newline at end of file
@@ -0,0 +1,21 @@
+import time
+
+from src.api.routes.chat import _extract_remember_content
+
+
+def test_extract_remember_content():
+    assert _extract_remember_content("remember this number: 6") == "number: 6"
+    assert _extract_remember_content("remember that I prefer dark mode") == "I prefer dark mode"
+    assert _extract_remember_content("  REMEMBER the following:  x  ") == "x"
+    assert _extract_remember_content("remember that") == "that"
+    assert _extract_remember_content("hello") is None
+    assert _extract_remember_content("rememberx y") is None
+    assert _extract_remember_content("remember   ") is None
+
+
+def test_extract_remember_content_pathological_input():
+    # Long runs of filler words / whitespace must not blow up the regex
+    start = time.perf_counter()
+    _extract_remember_content("remember " + "the " * 5000)
+    _extract_remember_content("remember" + " " * 20000 + "\t")
+    assert time.perf_counter() - start < 0.5
@@ -0,0 +1,120 @@
+import io
+
+import pytest
+
+from src.api.routes import logs
+from src.api.routes.logs import _iter_lines_reverse
+
+
+def test_iter_lines_reverse_matches_readlines():
+    data = "first\nsecond line\n\nthird — ünïcode\r\nlast without newline".encode()
+    expected = []
+    offset = 0
+    for raw in data.split(b"\n"):
+        expected.append((offset, raw.decode()))
+        offset += len(raw) + 1
+    expected.reverse()
+    # Tiny blocks force lines (and a multi-byte char) to straddle block boundaries
+    for block_size in (1, 3, 7, 1024):
+        got = list(_iter_lines_reverse(io.BytesIO(data), block_size=block_size))
+        assert got == expected, block_size
+
+
+def test_iter_lines_reverse_stops_at_end_offset():
+    data = b"a\nbb\nccc\n"
+    assert list(_iter_lines_reverse(io.BytesIO(data), end=5)) == [(5, ""), (2, "bb"), (0, "a")]
+
+
+def test_iter_lines_reverse_empty_file():
+    assert list(_iter_lines_reverse(io.BytesIO(b""))) == []
+
+
+def _log_line(i: int, level: str = "INFO", source: str = "src.core.sena:process:1") -> str:
+    return f"2026-10-17 00:{i // 60 % 60:02d}:{i % 60:02d}.{i % 1000:03d} | {level:<8} | {source} - message {i}\n"
+
+
+def _fresh_load(log_file, limit=1000, level="all", source="all"):
+    logs._PARSE_CACHE.clear()
+    return logs._load_logs([log_file], limit, level, source)
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(logs, "_cleared_at", None)
+    monkeypatch.setattr(logs, "_PARSE_CACHE", {})
+    monkeypatch.setattr(logs, "_SOURCE_CACHE", {})
+    monkeypatch.setattr(logs, "DEFAULT_LOG_FILE", tmp_path / "sena.log")
+    monkeypatch.setattr(logs, "SESSION_DIR", tmp_path / "sessions")
+    path = tmp_path / "sena.log"
+    path.write_text("".join(_log_line(i) for i in range(20)))
+    return path
+
+
+def test_load_logs_warm_append_matches_cold(log_file):
+    logs._load_logs([log_file], 1000, "all", "all")
+    with log_file.open("a") as fh:
+        fh.write(_log_line(20, "ERROR") + "not a log line\n" + _log_line(21))
+    warm = logs._load_logs([log_file], 1000, "all", "all")
+    assert [e["message"] for e in warm[:2]] == ["message 21", "message 20"]
+    assert warm == _fresh_load(log_file)
+
+
+def test_load_logs_partial_line_completed_later(log_file):
+    with log_file.open("a") as fh:
+        fh.write(_log_line(20)[:-5])
+    first = logs._load_logs([log_file], 1000, "all", "all")
+    assert first[0]["message"] == "messag"
+    with log_file.open("a") as fh:
+        fh.write(_log_line(20)[-5:] + _log_line(21))
+    warm = logs._load_logs([log_file], 1000, "all", "all")
+    assert [e["message"] for e in warm[:3]] == ["message 21", "message 20", "message 19"]
+    assert warm == _fresh_load(log_file)
+
+
+def test_load_logs_truncated_or_replaced(log_file):
+    logs._load_logs([log_file], 1000, "all", "all")
+    log_file.write_text(_log_line(50))  # truncated in place
+    assert [e["message"] for e in logs._load_logs([log_file], 1000, "all", "all")] == ["message 50"]
+    replacement = log_file.with_name("new.log")
+    replacement.write_text(_log_line(60) + _log_line(61))
+    replacement.replace(log_file)  # rotated: new inode
+    assert [e["message"] for e in logs._load_logs([log_file], 1000, "all", "all")] == ["message 61", "message 60"]
+
+
+def test_load_logs_prefilters_match_full_scan(log_file, monkeypatch):
+    levels = ("INFO", "ERROR", "DEBUG")
+    sources = ("src.core.sena:process:1", "src.memory.manager:remember:40")
+    log_file.write_text("".join(_log_line(i, levels[i % 3], sources[i % 2]) for i in range(200)))
+    cases = [("all", "all"), ("error", "all"), ("all", "memory"), ("debug", "SENA")]
+    expected = {case: _fresh_load(log_file, 1000, *case) for case in cases}
+    # A tiny cache forces most entries through the prefiltered backwards scan
+    monkeypatch.setattr(logs, "_PARSE_CACHE_MAX_ENTRIES", 7)
+    for case in cases:
+        assert _fresh_load(log_file, 1000, *case) == expected[case], case
+        assert logs._load_logs([log_file], 1000, *case) == expected[case], case
+
+
+def test_load_logs_stops_at_cleared_watermark(log_file, monkeypatch):
+    monkeypatch.setattr(logs, "_cleared_at", _log_line(14)[:23])
+    assert [e["message"] for e in _fresh_load(log_file)] == [f"message {i}" for i in range(19, 14, -1)]
+
+
+def test_scan_sources_incremental(log_file, monkeypatch):
+    # Tiny blocks force lines (and the partial tail) to straddle block boundaries
+    monkeypatch.setattr(logs, "_READ_BLOCK_SIZE", 7)
+    assert logs._scan_sources() == {"src.core.sena:process:1"}
+    with log_file.open("a") as fh:
+        fh.write(_log_line(20, source="src.api.server:health:9")[:-5])
+    assert logs._scan_sources() == {"src.core.sena:process:1", "src.api.server:health:9"}
+    with log_file.open("a") as fh:
+        fh.write(_log_line(20)[-5:] + _log_line(21, source="src.memory.manager:remember:40"))
+    assert logs._scan_sources() == {
+        "src.core.sena:process:1",
+        "src.api.server:health:9",
+        "src.memory.manager:remember:40",
+    }
+    log_file.write_text(_log_line(0, source="src.llm.manager:generate:3"))  # truncated in place
+    assert logs._scan_sources() == {"src.llm.manager:generate:3"}
+    log_file.unlink()
+    assert logs._scan_sources() == set()
+    assert not logs._SOURCE_CACHE
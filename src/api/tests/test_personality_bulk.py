@@ -0,0 +1,67 @@
+import pytest
+from pydantic import ValidationError
+
+from src.api.routes.personality import BulkActionRequest  # imports src.memory in dependency order
+from src.database.connection import DatabaseManager
+from src.database.repositories import personality_repo
+from src.database.repositories.personality_repo import PersonalityRepository
+from src.memory.personality import PersonalityManager
+
+
+@pytest.fixture
+async def manager(tmp_path, monkeypatch):
+    db = DatabaseManager(str(tmp_path / "sena.db"))
+    await db.initialize()
+    mgr = PersonalityManager()
+    mgr._repo = PersonalityRepository(db)
+    broadcasts: list[tuple[str, str]] = []
+
+    async def record(action, fragment_id, content):
+        broadcasts.append((action, fragment_id))
+
+    monkeypatch.setattr(mgr, "_broadcast_personality_update", record)
+    mgr.broadcasts = broadcasts
+    yield mgr
+    await db.close()
+
+
+async def _create(mgr, n):
+    return [(await mgr._repo.create_fragment(f"fact {i}"))["fragment_id"] for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_bulk_apply_overlapping_ids_use_last_action(manager):
+    a, b, c, d = await _create(manager, 4)
+
+    results = await manager.bulk_apply(approve=[a, b, d, d], reject=[b], delete=[a, c, "missing"])
+
+    assert results == {
+        "approved": {d: True},
+        "rejected": {b: True},
+        "deleted": {a: True, c: True, "missing": False},
+    }
+    remaining = await manager._repo.get_by_ids([a, b, c, d])
+    assert {fid: f["status"] for fid, f in remaining.items()} == {b: "rejected", d: "approved"}
+    audit = await manager._repo.get_audit_log(limit=50)
+    assert sorted((e["fragment_id"], e["action"]) for e in audit) == sorted(
+        [(a, "deleted"), (b, "rejected"), (c, "deleted"), (d, "approved")]
+    )
+    assert sorted(manager.broadcasts) == sorted([("approved", d), ("rejected", b)])
+
+
+@pytest.mark.asyncio
+async def test_bulk_apply_splits_large_in_lists(manager, monkeypatch):
+    monkeypatch.setattr(personality_repo, "_IN_CHUNK_SIZE", 2)
+    ids = await _create(manager, 5)
+
+    results = await manager.bulk_apply(approve=ids[:3], delete=ids[3:])
+
+    assert all(results["approved"].values()) and all(results["deleted"].values())
+    fragments = await manager._repo.get_by_ids(ids)
+    assert sorted(fragments) == sorted(ids[:3])
+    assert all(f["status"] == "approved" for f in fragments.values())
+
+
+def test_bulk_request_caps_list_sizes():
+    with pytest.raises(ValidationError):
+        BulkActionRequest(delete=["id"] * 1001)
@@ -0,0 +1,54 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.routes.personality import PersonalityManager
+
+
+class _SlowRepo:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_approved(self, limit):
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return [{"content": f"fact {self.calls}"}]
+
+
+def _manager():
+    mgr = PersonalityManager()
+    mgr._repo = _SlowRepo()
+    cfg = SimpleNamespace(max_fragments_in_prompt=5, compress_threshold=10, personality_token_budget=100)
+    mgr._get_personality_config = lambda: cfg
+    return mgr
+
+
+@pytest.mark.asyncio
+async def test_stats_only_write_does_not_restart_block_build():
+    mgr = _manager()
+    build = asyncio.create_task(mgr.get_personality_block())
+    await asyncio.sleep(0)
+    mgr._invalidate_stats()  # e.g. a new pending fragment
+    await build
+    assert mgr._repo.calls == 1
+    assert not mgr._cache_dirty
+
+
+@pytest.mark.asyncio
+async def test_block_rebuilds_are_capped_under_constant_invalidation():
+    mgr = _manager()
+
+    async def invalidate_forever():
+        while True:
+            await asyncio.sleep(0.005)
+            mgr.invalidate_cache()
+
+    spam = asyncio.create_task(invalidate_forever())
+    try:
+        block = await mgr.get_personality_block()
+    finally:
+        spam.cancel()
+    assert "fact" in block
+    assert mgr._repo.calls == PersonalityManager._MAX_STALE_REBUILDS + 1
+    assert mgr._block_cache is None
@@ -0,0 +1,48 @@
+import orjson
+import pytest
+
+from src.api.routes.personality import list_fragments
+from src.database.connection import DatabaseManager
+from src.database.repositories import personality_repo
+from src.database.repositories.personality_repo import PersonalityRepository
+from src.memory.personality import PersonalityManager
+
+
+@pytest.fixture
+async def repo(tmp_path):
+    db = DatabaseManager(str(tmp_path / "sena.db"))
+    await db.initialize()
+    yield PersonalityRepository(db)
+    await db.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_fragments_reads_in_batches(repo, monkeypatch):
+    monkeypatch.setattr(personality_repo, "_STREAM_BATCH_SIZE", 2)
+    for i in range(5):
+        await repo.create_fragment(f"fact {i}")
+    expected = [f["fragment_id"] for f in await repo.get_all(limit=4, offset=1)]
+
+    streamed = [f["fragment_id"] async for f in repo.iter_fragments(limit=4, offset=1)]
+
+    assert streamed == expected
+    assert len([f async for f in repo.iter_fragments(limit=100)]) == 5
+
+
+@pytest.mark.asyncio
+async def test_ndjson_stream_reports_errors(repo, monkeypatch):
+    await repo.create_fragment("fact")
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError("db gone")
+
+    monkeypatch.setattr(repo.db, "fetch_all", broken)
+    mgr = PersonalityManager()
+    mgr._repo = repo
+
+    response = await list_fragments(
+        request=None, status=None, fragment_type=None, limit=10, offset=0, format="ndjson", mgr=mgr
+    )
+    lines = [orjson.loads(chunk) async for chunk in response.body_iterator]
+
+    assert lines == [{"error": "db gone"}]
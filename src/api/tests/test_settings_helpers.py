@@ -0,0 +1,48 @@
+import pytest
+
+from src.api.routes.settings import (
+    _LLM_FIELDS,
+    _LLM_MODEL_SLOTS,
+    _LOGGING_FIELDS,
+    _MEMORY_FIELDS,
+    _TELEMETRY_FIELDS,
+    _UI_FIELDS,
+    LLMSettingsRequest,
+    LoggingSettingsRequest,
+    MemorySettingsRequest,
+    TelemetrySettingsRequest,
+    UISettingsRequest,
+    _apply_updates,
+    _normalize_level,
+)
+from src.config.settings import Settings
+
+
+@pytest.mark.parametrize(
+    "model, fields, extra",
+    [
+        (LLMSettingsRequest, _LLM_FIELDS, set(_LLM_MODEL_SLOTS)),
+        (MemorySettingsRequest, _MEMORY_FIELDS, set()),
+        (LoggingSettingsRequest, _LOGGING_FIELDS, set()),
+        (TelemetrySettingsRequest, _TELEMETRY_FIELDS, set()),
+        (UISettingsRequest, _UI_FIELDS, set()),
+    ],
+)
+def test_field_maps_cover_request_models(model, fields, extra):
+    assert set(model.model_fields) == set(fields) | extra
+    s = Settings()
+    for owner, attr in fields.values():
+        assert hasattr(owner(s), attr)
+
+
+def test_apply_updates_sets_nested_targets():
+    s = Settings()
+    _apply_updates(s, {"retrieval_max_results": 7, "personality_token_budget": 100}, _MEMORY_FIELDS)
+    assert s.memory.retrieval.max_results == 7
+    assert s.memory.personality.personality_token_budget == 100
+
+
+def test_normalize_level():
+    assert _normalize_level("INFO") == "INFO"
+    assert _normalize_level("debug") == "DEBUG"
+    assert _normalize_level("verbose") is None
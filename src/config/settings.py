@@ -455,6 +455,7 @@ def resolve_data_path(relative_path: str) -> Path:
     return get_app_data_dir() / relative_path
 
 
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     """
     Return the path to the active settings.yaml file.
@@ -466,6 +467,8 @@ def get_config_path() -> Path:
     Development:
         Searches common locations under the project tree and returns the first
         match, falling back to src/config/settings.yaml.
+
+    The result is cached for the life of the process; reload_settings() clears it.
     """
     if getattr(sys, "frozen", False):
         config_path = get_app_data_dir() / "settings.yaml"
@@ -494,7 +497,7 @@ def get_config_path() -> Path:
     return Path(__file__).parent / "settings.yaml"
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
@@ -513,5 +516,6 @@ def reload_settings() -> Settings:
     Returns:
         Fresh Settings instance
     """
+    get_config_path.cache_clear()
     get_settings.cache_clear()
     return get_settings()
@@ -58,6 +58,12 @@ async def initialize(self) -> None:
         # Run migrations
         await self._run_migrations()
 
+        # Pre-open the pool so early requests don't each pay for a connect
+        # plus the per-connection PRAGMAs.
+        async with self._pool_lock:
+            while len(self._pool) < self.pool_size:
+                self._pool.append(await self._open_connection())
+
         self._initialized = True
         logger.info("Database initialized successfully")
 
@@ -292,8 +298,35 @@ def _get_migrations(self) -> dict[int, str]:
                 CREATE INDEX IF NOT EXISTS idx_personality_audit_fragment ON personality_audit(fragment_id);
                 CREATE INDEX IF NOT EXISTS idx_personality_audit_timestamp ON personality_audit(timestamp);
             """,
+            4: """
+                -- Composite indexes matching the personality list/audit queries
+                -- (filter columns first, then the ORDER BY column) so SQLite can
+                -- walk the index newest-first and stop at LIMIT instead of sorting.
+                CREATE INDEX IF NOT EXISTS idx_personality_status_created
+                    ON personality_fragments(status, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_personality_status_type_created
+                    ON personality_fragments(status, fragment_type, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_personality_created
+                    ON personality_fragments(created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_personality_audit_fragment_timestamp
+                    ON personality_audit(fragment_id, timestamp DESC);
+            """,
         }
 
+    async def _open_connection(self) -> aiosqlite.Connection:
+        """Open a pooled connection with the per-connection settings applied."""
+        conn = await aiosqlite.connect(
+            self.db_path,
+            timeout=self.timeout,
+        )
+        conn.row_factory = aiosqlite.Row
+        # Apply per-connection settings.  WAL is already set at the
+        # database level, but busy_timeout must be set per-connection.
+        await conn.execute("PRAGMA busy_timeout=10000")
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     @asynccontextmanager
     async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
         """
@@ -313,16 +346,7 @@ async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
 
             # Create new if pool empty
             if conn is None:
-                conn = await aiosqlite.connect(
-                    self.db_path,
-                    timeout=self.timeout,
-                )
-                conn.row_factory = aiosqlite.Row
-                # Apply per-connection settings.  WAL is already set at the
-                # database level, but busy_timeout must be set per-connection.
-                await conn.execute("PRAGMA busy_timeout=10000")
-                await conn.execute("PRAGMA journal_mode=WAL")
-                await conn.execute("PRAGMA synchronous=NORMAL")
+                conn = await self._open_connection()
 
             yield conn
 
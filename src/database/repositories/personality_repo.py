@@ -10,11 +10,22 @@
 import json
 import uuid
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 from src.database.connection import DatabaseManager
 from src.utils.logger import logger
 
+# Ids bound per ``IN (...)`` clause — well under SQLite's bound-variable limit
+# (999 before 3.32), so any batch size is split into several statements.
+_IN_CHUNK_SIZE = 500
+
+# Rows per query in iter_fragments(); the connection is released between batches.
+_STREAM_BATCH_SIZE = 64
+
+
+def _chunked(ids: list[str]) -> list[list[str]]:
+    return [ids[i : i + _IN_CHUNK_SIZE] for i in range(0, len(ids), _IN_CHUNK_SIZE)]
+
 
 class PersonalityRepository:
     """Data access layer for personality fragments and audit trail."""
@@ -94,20 +105,7 @@ async def get_all(
             List of fragment dicts.
         """
         try:
-            conditions: list[str] = []
-            params: list[Any] = []
-
-            if status:
-                conditions.append("status = ?")
-                params.append(status)
-            if fragment_type:
-                conditions.append("fragment_type = ?")
-                params.append(fragment_type)
-            if category:
-                conditions.append("category = ?")
-                params.append(category)
-
-            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            where, params = self._fragment_filters(status, fragment_type, category)
             params.extend([limit, offset])
 
             rows = await self.db.fetch_all(
@@ -129,6 +127,112 @@ async def get_all(
             logger.error(f"Error fetching personality fragments: {e}", exc_info=True)
             return []
 
+    async def get_page(
+        self,
+        status: Optional[str] = None,
+        fragment_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Fetch one page of fragments together with the total number of matches.
+
+        The total comes from ``COUNT(*) OVER ()`` in the same query, so paging
+        needs a single round-trip; only a page past the end falls back to COUNT.
+
+        Args:
+            status: Filter by status ("pending", "approved", "rejected").
+            fragment_type: Filter by type ("explicit", "inferred").
+            limit: Max rows to return.
+            offset: Pagination offset.
+
+        Returns:
+            Tuple of (fragment dicts, total matching rows).
+        """
+        try:
+            where, params = self._fragment_filters(status, fragment_type)
+
+            rows = await self.db.fetch_all(
+                f"""
+                SELECT id, fragment_id, content, fragment_type, category,
+                       confidence, status, source, version,
+                       created_at, updated_at, approved_at, metadata,
+                       COUNT(*) OVER () AS total
+                FROM personality_fragments
+                {where}
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                (*params, limit, offset),
+            )
+
+            if rows:
+                total = int(rows[0][13])
+                return [self._row_to_dict(row) for row in rows], total
+            if not offset:
+                return [], 0
+
+            count_row = await self.db.fetch_one(f"SELECT COUNT(*) FROM personality_fragments {where}", tuple(params))
+            total = int(count_row[0]) if count_row else 0
+            return [], total
+
+        except Exception as e:
+            logger.error(f"Error fetching personality fragment page: {e}", exc_info=True)
+            return [], 0
+
+    async def iter_fragments(
+        self,
+        status: Optional[str] = None,
+        fragment_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield fragments one at a time, read in small batches.
+
+        Same filters and ordering as get_all(). Each batch of
+        _STREAM_BATCH_SIZE rows is its own short query, so the pooled
+        connection goes back to the pool before any row is yielded and a
+        slow consumer never holds it.
+
+        Args:
+            status: Filter by status ("pending", "approved", "rejected").
+            fragment_type: Filter by type ("explicit", "inferred").
+            limit: Max rows to yield.
+            offset: Pagination offset.
+
+        Yields:
+            Fragment dicts, newest first.
+
+        Raises:
+            Exception: Database errors are logged and re-raised so the caller
+                can tell a failed stream from a short one.
+        """
+        where, params = self._fragment_filters(status, fragment_type)
+        remaining = limit
+        while remaining > 0:
+            batch_size = min(remaining, _STREAM_BATCH_SIZE)
+            try:
+                rows = await self.db.fetch_all(
+                    f"""
+                    SELECT id, fragment_id, content, fragment_type, category,
+                           confidence, status, source, version,
+                           created_at, updated_at, approved_at, metadata
+                    FROM personality_fragments
+                    {where}
+                    ORDER BY created_at DESC
+                    LIMIT ? OFFSET ?
+                    """,
+                    (*params, batch_size, offset),
+                )
+            except Exception as e:
+                logger.error(f"Error streaming personality fragments: {e}", exc_info=True)
+                raise
+            for row in rows:
+                yield self._row_to_dict(row)
+            if len(rows) < batch_size:
+                return
+            remaining -= batch_size
+            offset += batch_size
+
     async def get_approved(self, limit: int = 50) -> list[dict[str, Any]]:
         """Return all approved fragments, most recent first.
 
@@ -260,6 +364,81 @@ async def reject_fragment(self, fragment_id: str) -> bool:
         """
         return await self.update_fragment(fragment_id, status="rejected")
 
+    async def get_by_ids(self, fragment_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch several fragments in one query.
+
+        Args:
+            fragment_ids: UUIDs to look up.
+
+        Returns:
+            Mapping of fragment_id -> fragment dict for the ids that exist.
+        """
+        if not fragment_ids:
+            return {}
+        fragments: dict[str, dict[str, Any]] = {}
+        for chunk in _chunked(fragment_ids):
+            rows = await self.db.fetch_all(
+                f"""
+                SELECT id, fragment_id, content, fragment_type, category,
+                       confidence, status, source, version,
+                       created_at, updated_at, approved_at, metadata
+                FROM personality_fragments
+                WHERE fragment_id IN ({", ".join("?" * len(chunk))})
+                """,
+                tuple(chunk),
+            )
+            fragments.update((row[1], self._row_to_dict(row)) for row in rows)
+        return fragments
+
+    async def bulk_apply(
+        self,
+        approve: list[str],
+        reject: list[str],
+        delete: list[str],
+    ) -> bool:
+        """Approve, reject and delete sets of fragments in a single transaction.
+
+        Each non-empty list becomes set-oriented ``... WHERE fragment_id IN (...)``
+        statements (one per _IN_CHUNK_SIZE ids) instead of one statement (and
+        commit) per fragment.
+
+        Args:
+            approve: UUIDs to mark approved.
+            reject: UUIDs to mark rejected.
+            delete: UUIDs to hard-delete.
+
+        Returns:
+            True on success; the whole batch is rolled back on failure.
+        """
+        try:
+            now = datetime.now().isoformat()
+            async with self.db.transaction() as conn:
+                for chunk in _chunked(approve):
+                    await conn.execute(
+                        "UPDATE personality_fragments SET updated_at = ?, status = 'approved', approved_at = ? "
+                        f"WHERE fragment_id IN ({', '.join('?' * len(chunk))})",
+                        (now, now, *chunk),
+                    )
+                for chunk in _chunked(reject):
+                    await conn.execute(
+                        "UPDATE personality_fragments SET updated_at = ?, status = 'rejected' "
+                        f"WHERE fragment_id IN ({', '.join('?' * len(chunk))})",
+                        (now, *chunk),
+                    )
+                for chunk in _chunked(delete):
+                    await conn.execute(
+                        f"DELETE FROM personality_fragments WHERE fragment_id IN ({', '.join('?' * len(chunk))})",
+                        tuple(chunk),
+                    )
+            logger.info(
+                f"Bulk-applied personality changes: {len(approve)} approved, "
+                f"{len(reject)} rejected, {len(delete)} deleted"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error bulk-applying personality changes: {e}", exc_info=True)
+            return False
+
     # ──────────────────────────────────────────────────────────────────────────
     # Audit log
     # ──────────────────────────────────────────────────────────────────────────
@@ -314,6 +493,43 @@ async def write_audit(
             # Audit failures must never crash the main flow
             logger.warning(f"Failed to write personality audit entry: {e}")
 
+    async def write_audit_many(self, entries: list[dict[str, Any]]) -> None:
+        """Append several audit entries with one executemany call.
+
+        Args:
+            entries: Dicts with the same keys as write_audit()'s arguments.
+        """
+        if not entries:
+            return
+        now = datetime.now().isoformat()
+        try:
+            await self.db.execute_many(
+                """
+                INSERT INTO personality_audit
+                    (fragment_id, action, old_content, new_content,
+                     old_status, new_status, confidence, reason, timestamp, metadata)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        entry["fragment_id"],
+                        entry["action"],
+                        entry.get("old_content"),
+                        entry.get("new_content"),
+                        entry.get("old_status"),
+                        entry.get("new_status"),
+                        entry.get("confidence"),
+                        entry.get("reason"),
+                        now,
+                        json.dumps(entry.get("metadata") or {}),
+                    )
+                    for entry in entries
+                ],
+            )
+        except Exception as e:
+            # Audit failures must never crash the main flow
+            logger.warning(f"Failed to write personality audit entries: {e}")
+
     async def get_audit_log(
         self,
         fragment_id: Optional[str] = None,
@@ -396,6 +612,29 @@ async def get_stats(self) -> dict[str, Any]:
     # Private helpers
     # ──────────────────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _fragment_filters(
+        status: Optional[str] = None,
+        fragment_type: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> tuple[str, list[Any]]:
+        """Build the WHERE clause and params shared by the fragment list queries."""
+        conditions: list[str] = []
+        params: list[Any] = []
+
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if fragment_type:
+            conditions.append("fragment_type = ?")
+            params.append(fragment_type)
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
     async def _get_by_fragment_id(self, fragment_id: str) -> Optional[dict[str, Any]]:
         row = await self.db.fetch_one(
             """
@@ -30,6 +30,8 @@ class ExtensionManager:
 
     def __init__(self, base_paths: Optional[List[Path]] = None):
         self._extensions: Dict[str, Extension] = {}
+        # Snapshot returned by list(); dropped whenever the registry changes
+        self._list_cache: Optional[List[Dict[str, Any]]] = None
         if base_paths is None:
             repo_root = Path(__file__).parent
             self._search_paths = [repo_root / "user", repo_root / "generated", repo_root / "core"]
@@ -78,6 +80,7 @@ def load(self, module_name: str) -> Extension:
             meta = getattr(module, "EXTENSION_METADATA", {}) if hasattr(module, "EXTENSION_METADATA") else {}
             ext = Extension(name=module_name, module=module, enabled=True, metadata=meta)
             self._extensions[module_name] = ext
+            self._list_cache = None
             logger.info(f"Loaded extension: {module_name}")
             return ext
         except Exception as e:
@@ -91,6 +94,7 @@ def reload(self, module_name: str) -> Extension:
         try:
             module = importlib.reload(self._extensions[module_name].module)
             self._extensions[module_name].module = module
+            self._list_cache = None
             logger.info(f"Reloaded extension: {module_name}")
             return self._extensions[module_name]
         except Exception as e:
@@ -100,6 +104,7 @@ def reload(self, module_name: str) -> Extension:
     def enable(self, module_name: str) -> None:
         if module_name in self._extensions:
             self._extensions[module_name].enabled = True
+            self._list_cache = None
             logger.info(f"Enabled extension: {module_name}")
         else:
             raise KeyError(module_name)
@@ -107,19 +112,23 @@ def enable(self, module_name: str) -> None:
     def disable(self, module_name: str) -> None:
         if module_name in self._extensions:
             self._extensions[module_name].enabled = False
+            self._list_cache = None
             logger.info(f"Disabled extension: {module_name}")
         else:
             raise KeyError(module_name)
 
     def list(self) -> List[Dict[str, Any]]:
-        return [
-            {
-                "name": name,
-                "enabled": ext.enabled,
-                "metadata": ext.metadata or {},
-            }
-            for name, ext in self._extensions.items()
-        ]
+        """Return a snapshot of loaded extensions (shared between calls — do not mutate)."""
+        if self._list_cache is None:
+            self._list_cache = [
+                {
+                    "name": name,
+                    "enabled": ext.enabled,
+                    "metadata": ext.metadata or {},
+                }
+                for name, ext in self._extensions.items()
+            ]
+        return self._list_cache
 
     def get(self, module_name: str) -> Optional[Extension]:
         return self._extensions.get(module_name)
@@ -137,6 +146,7 @@ def remove(self, module_name: str) -> None:
         except Exception:
             pass
         del self._extensions[module_name]
+        self._list_cache = None
 
     def validate(self, module_name: str) -> Dict[str, Any]:
         """Run a lightweight validation of an extension's interface.
@@ -33,3 +33,18 @@ def test_load_reload_enable_disable(tmp_path):
         assert False, "Expected KeyError"
     except KeyError:
         pass
+
+
+def test_list_snapshot_invalidated_on_toggle():
+    mgr = get_extension_manager()
+    first = mgr.list()
+    assert mgr.list() is first  # cached between calls
+
+    name = first[0]["name"]
+    mgr.disable(name)
+    try:
+        updated = mgr.list()
+        assert updated is not first
+        assert next(e for e in updated if e["name"] == name)["enabled"] is False
+    finally:
+        mgr.enable(name)
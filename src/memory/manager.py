@@ -1,5 +1,6 @@
 """Main memory orchestrator coordinating all memory systems."""
 
+import asyncio
 from typing import Any, Optional
 
 from src.api.websocket.manager import ws_manager
@@ -62,6 +63,8 @@ def __init__(
         )
 
         self.initialized = False
+        # Owned by the manager so concurrent first callers share one initialization
+        self._init_lock = asyncio.Lock()
         logger.info("MemoryManager initialized")
 
     @classmethod
@@ -99,36 +102,46 @@ def set_instance(cls, instance: "MemoryManager") -> None:
     async def initialize(self) -> bool:
         """Initialize all memory systems.
 
+        Safe to call repeatedly and concurrently — returns immediately once
+        initialized, and concurrent first callers wait for a single attempt.
+
         Returns:
             True if all systems initialized successfully
         """
-        try:
-            logger.info("Initializing memory systems...")
+        if self.initialized:
+            return True
 
-            if not self.db:
-                from src.database.connection import get_db
+        async with self._init_lock:
+            if self.initialized:
+                return True
 
-                self.db = await get_db()
-                self.long_term.db = self.db
+            try:
+                logger.info("Initializing memory systems...")
 
-            # Check mem0 connection
-            mem0_connected = await self.mem0_client.check_connection()
-            if not mem0_connected:
-                logger.warning("mem0 not available, using local storage only")
+                if not self.db:
+                    from src.database.connection import get_db
 
-            # Initialize database tables if needed
-            if self.db:
-                await self.db.initialize()
-                logger.info("Database initialized for memory storage")
+                    self.db = await get_db()
+                    self.long_term.db = self.db
 
-            self.initialized = True
-            logger.info("Memory systems initialized successfully")
-            return True
+                # Check mem0 connection
+                mem0_connected = await self.mem0_client.check_connection()
+                if not mem0_connected:
+                    logger.warning("mem0 not available, using local storage only")
 
-        except Exception as e:
-            logger.error(f"Error initializing memory systems: {e}")
-            self.initialized = False
-            return False
+                # Initialize database tables if needed
+                if self.db:
+                    await self.db.initialize()
+                    logger.info("Database initialized for memory storage")
+
+                self.initialized = True
+                logger.info("Memory systems initialized successfully")
+                return True
+
+            except Exception as e:
+                logger.error(f"Error initializing memory systems: {e}")
+                self.initialized = False
+                return False
 
     # Short-term memory operations
     async def add_to_context(self, content: str, role: str = "user", metadata: Optional[dict] = None) -> Any:
@@ -31,16 +31,24 @@
 import asyncio
 import json
 import re
+import secrets
+import time
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
 from src.utils.logger import logger
 
+_T = TypeVar("_T")
+
 
 class PersonalityManager:
     """Orchestrate personality fragment storage, inference, and system prompt composition."""
 
     _instance: Optional["PersonalityManager"] = None
+    _STATS_TTL = 30.0
+    # Rebuilds allowed when writes keep landing mid-build; after that the last
+    # result is returned uncached rather than looping (and re-compressing) again
+    _MAX_STALE_REBUILDS = 2
 
     def __init__(self) -> None:
         self._repo: Optional[Any] = None  # PersonalityRepository, set during initialize()
@@ -53,6 +61,23 @@ def __init__(self) -> None:
         self._block_cache: Optional[str] = None
         self._cache_dirty: bool = True
 
+        # Aggregate stats tolerate brief staleness; cached for _STATS_TTL seconds
+        # and dropped on any fragment write.
+        self._stats_cache: Optional[tuple[float, dict[str, Any]]] = None
+
+        # In-flight cache rebuilds keyed by name, so concurrent cache misses share
+        # one DB query (and LLM compression) instead of each running their own.
+        self._inflight: dict[str, asyncio.Future] = {}
+
+        # Change counters checked by in-flight rebuilds. _block_version moves only
+        # when the approved block can change (invalidate_cache); _stats_version on
+        # every fragment write and personality settings change, so with a
+        # per-process token it also forms the ETag that lets polling clients
+        # revalidate without refetching rows.
+        self._block_version: int = 0
+        self._stats_version: int = 0
+        self._etag_token: str = secrets.token_hex(4)
+
     # ──────────────────────────────────────────────────────────────────────────
     # Singleton
     # ──────────────────────────────────────────────────────────────────────────
@@ -126,44 +151,105 @@ async def get_personality_block(self, force_refresh: bool = False) -> str:
         Returns:
             Formatted personality block string.
         """
-        from src.llm.prompts.personality_prompts import build_personality_block
-
         if not self._cache_dirty and not force_refresh and self._block_cache is not None:
             return self._block_cache
 
+        return await self._singleflight("block", self._build_personality_block)
+
+    async def _build_personality_block(self) -> str:
+        """Rebuild the personality block from the DB and store it in the cache.
+
+        If the block is invalidated while the build is awaiting the DB or LLM,
+        the result is discarded and the block rebuilt, so a pre-write block is
+        never cached. Pending-only writes don't count. After _MAX_STALE_REBUILDS
+        retries the latest result is returned without being cached.
+        """
+        from src.llm.prompts.personality_prompts import build_personality_block
+
         try:
             if not self._repo:
                 return build_personality_block(None)
 
-            cfg = self._get_personality_config()
-            approved = await self._repo.get_approved(limit=cfg.max_fragments_in_prompt * 2)
-
-            if not approved:
-                block = build_personality_block(None)
-            elif len(approved) > cfg.compress_threshold:
-                # Compress via LLM when there are many fragments
-                content = await self._compress_fragments(approved, cfg.personality_token_budget)
-                block = build_personality_block(content)
-            else:
-                # Cap to max_fragments_in_prompt and format as bullet list
-                capped = approved[: cfg.max_fragments_in_prompt]
-                lines = [f"- {f['content']}" for f in capped]
-                block = build_personality_block("\n".join(lines))
-
-            self._block_cache = block
-            self._cache_dirty = False
+            for _ in range(self._MAX_STALE_REBUILDS + 1):
+                version = self._block_version
+                cfg = self._get_personality_config()
+                approved = await self._repo.get_approved(limit=cfg.max_fragments_in_prompt * 2)
+
+                if not approved:
+                    block = build_personality_block(None)
+                elif len(approved) > cfg.compress_threshold:
+                    # Compress via LLM when there are many fragments
+                    content = await self._compress_fragments(approved, cfg.personality_token_budget)
+                    block = build_personality_block(content)
+                else:
+                    # Cap to max_fragments_in_prompt and format as bullet list
+                    capped = approved[: cfg.max_fragments_in_prompt]
+                    lines = [f"- {f['content']}" for f in capped]
+                    block = build_personality_block("\n".join(lines))
+
+                if self._block_version == version:
+                    self._block_cache = block
+                    self._cache_dirty = False
+                    return block
             return block
 
         except Exception as e:
             logger.error(f"Error building personality block: {e}", exc_info=True)
-            from src.llm.prompts.personality_prompts import build_personality_block
-
             return build_personality_block(None)
 
+    async def _singleflight(self, key: str, build: Callable[[], Awaitable[_T]]) -> _T:
+        """Run *build* once for all concurrent callers using the same *key*.
+
+        The first caller runs it; callers that arrive while it is in flight
+        await the same future instead of starting a duplicate rebuild.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # this caller was cancelled, not the shared build
+                # The caller running the build was cancelled; take over
+                return await self._singleflight(key, build)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await build()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # An invalidation may already have replaced this entry with a newer build
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
     def invalidate_cache(self) -> None:
-        """Mark the block cache as stale so the next call rebuilds from DB."""
+        """Mark the block and stats caches as stale so the next call rebuilds from DB."""
         self._cache_dirty = True
         self._block_cache = None
+        # New callers must not join a build that started before this write
+        self._inflight.pop("block", None)
+        self._block_version += 1
+        self._invalidate_stats()
+
+    def _invalidate_stats(self) -> None:
+        """Record a fragment change that leaves the approved block untouched."""
+        self._stats_cache = None
+        self._inflight.pop("stats", None)
+        self._stats_version += 1
+
+    def etag(self) -> str:
+        """Return a weak ETag that changes on any fragment write or personality settings change."""
+        return f'W/"{self._etag_token}-{self._stats_version}"'
 
     # ──────────────────────────────────────────────────────────────────────────
     # Explicit Fragment Storage (user-stated facts)
@@ -315,6 +401,7 @@ async def infer_from_conversation(
                     )
                     self.invalidate_cache()
                 else:
+                    self._invalidate_stats()
                     logger.info(
                         f"Inferred fragment pending approval (confidence={confidence:.2f}): {fragment['fragment_id']}"
                     )
@@ -461,7 +548,12 @@ async def reject_fragment(self, fragment_id: str, reason: Optional[str] = None)
                     confidence=fragment["confidence"],
                     reason=reason or "User rejected",
                 )
-                # No cache invalidation needed; rejected fragments don't appear in the block
+                if old_status == "approved":
+                    # The fragment was part of the prompt block, so drop it too
+                    self.invalidate_cache()
+                else:
+                    # A rejected pending fragment was never in the block; only the counts change
+                    self._invalidate_stats()
                 logger.info(f"Rejected personality fragment: {fragment_id}")
 
                 await self._broadcast_personality_update("rejected", fragment_id, fragment["content"])
@@ -562,6 +654,103 @@ async def delete_fragment(self, fragment_id: str) -> bool:
             logger.error(f"Error deleting fragment {fragment_id}: {e}", exc_info=True)
             return False
 
+    async def bulk_apply(
+        self,
+        approve: Optional[list[str]] = None,
+        reject: Optional[list[str]] = None,
+        delete: Optional[list[str]] = None,
+        reason: Optional[str] = None,
+    ) -> dict[str, dict[str, bool]]:
+        """Approve, reject and delete many fragments with one lookup and one write transaction.
+
+        An id listed under several actions is applied only under the last of
+        them (approve < reject < delete) and appears only in that action's results.
+
+        Args:
+            approve: UUIDs of fragments to approve.
+            reject: UUIDs of fragments to reject.
+            delete: UUIDs of fragments to delete.
+            reason: Optional reason recorded for approvals and rejections.
+
+        Returns:
+            ``{"approved": {id: ok}, "rejected": {...}, "deleted": {...}}``; ids that
+            don't exist map to False.
+        """
+        # Keep each id under its winning action only, so it gets one result, one
+        # audit row and one broadcast
+        delete = list(dict.fromkeys(delete or []))
+        superseded = set(delete)
+        reject = [fid for fid in dict.fromkeys(reject or []) if fid not in superseded]
+        superseded.update(reject)
+        approve = [fid for fid in dict.fromkeys(approve or []) if fid not in superseded]
+        results: dict[str, dict[str, bool]] = {
+            "approved": dict.fromkeys(approve, False),
+            "rejected": dict.fromkeys(reject, False),
+            "deleted": dict.fromkeys(delete, False),
+        }
+        if not self._repo:
+            return results
+
+        try:
+            fragments = await self._repo.get_by_ids(list({*approve, *reject, *delete}))
+            to_approve = [fid for fid in results["approved"] if fid in fragments]
+            to_reject = [fid for fid in results["rejected"] if fid in fragments]
+            to_delete = [fid for fid in results["deleted"] if fid in fragments]
+
+            if not await self._repo.bulk_apply(to_approve, to_reject, to_delete):
+                return results
+
+            audits: list[dict[str, Any]] = []
+            for action, ids, new_status, default_reason in (
+                ("approved", to_approve, "approved", "User approved"),
+                ("rejected", to_reject, "rejected", "User rejected"),
+            ):
+                for fid in ids:
+                    fragment = fragments[fid]
+                    results[action][fid] = True
+                    audits.append(
+                        {
+                            "fragment_id": fid,
+                            "action": action,
+                            "old_content": fragment["content"],
+                            "new_content": fragment["content"],
+                            "old_status": fragment["status"],
+                            "new_status": new_status,
+                            "confidence": fragment["confidence"],
+                            "reason": reason or default_reason,
+                        }
+                    )
+            for fid in to_delete:
+                fragment = fragments[fid]
+                results["deleted"][fid] = True
+                audits.append(
+                    {
+                        "fragment_id": fid,
+                        "action": "deleted",
+                        "old_content": fragment["content"],
+                        "old_status": fragment["status"],
+                        "reason": "User deleted fragment",
+                    }
+                )
+            await self._repo.write_audit_many(audits)
+
+            # One invalidation for the whole batch rather than one per fragment
+            self.invalidate_cache()
+            logger.info(
+                f"Bulk personality update: {len(to_approve)} approved, "
+                f"{len(to_reject)} rejected, {len(to_delete)} deleted"
+            )
+
+            for action, ids in (("approved", to_approve), ("rejected", to_reject)):
+                for fid in ids:
+                    await self._broadcast_personality_update(action, fid, fragments[fid]["content"])
+
+            return results
+
+        except Exception as e:
+            logger.error(f"Error bulk-applying personality changes: {e}", exc_info=True)
+            return results
+
     # ──────────────────────────────────────────────────────────────────────────
     # Query / Stats
     # ──────────────────────────────────────────────────────────────────────────
@@ -571,6 +760,7 @@ async def get_all_fragments(
         status: Optional[str] = None,
         fragment_type: Optional[str] = None,
         limit: int = 100,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         """Return fragments with optional filters.
 
@@ -578,13 +768,64 @@ async def get_all_fragments(
             status: Filter by "pending", "approved", or "rejected".
             fragment_type: Filter by "explicit" or "inferred".
             limit: Max results.
+            offset: Pagination offset.
 
         Returns:
             List of fragment dicts.
         """
         if not self._repo:
             return []
-        return await self._repo.get_all(status=status, fragment_type=fragment_type, limit=limit)
+        return await self._repo.get_all(status=status, fragment_type=fragment_type, limit=limit, offset=offset)
+
+    async def get_fragments_page(
+        self,
+        status: Optional[str] = None,
+        fragment_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return one page of fragments and the total number matching the filters.
+
+        Args:
+            status: Filter by "pending", "approved", or "rejected".
+            fragment_type: Filter by "explicit" or "inferred".
+            limit: Page size.
+            offset: Pagination offset.
+
+        Returns:
+            Tuple of (fragment dicts, total matching fragments).
+        """
+        if not self._repo:
+            return [], 0
+        page: tuple[list[dict[str, Any]], int] = await self._repo.get_page(
+            status=status, fragment_type=fragment_type, limit=limit, offset=offset
+        )
+        return page
+
+    async def iter_fragments(
+        self,
+        status: Optional[str] = None,
+        fragment_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield fragments one at a time (see PersonalityRepository.iter_fragments).
+
+        Args:
+            status: Filter by "pending", "approved", or "rejected".
+            fragment_type: Filter by "explicit" or "inferred".
+            limit: Max results.
+            offset: Pagination offset.
+
+        Yields:
+            Fragment dicts, newest first.
+        """
+        if not self._repo:
+            return
+        async for fragment in self._repo.iter_fragments(
+            status=status, fragment_type=fragment_type, limit=limit, offset=offset
+        ):
+            yield fragment
 
     async def get_pending_fragments(self) -> list[dict[str, Any]]:
         """Return all pending (awaiting approval) fragments.
@@ -623,17 +864,41 @@ async def get_stats(self) -> dict[str, Any]:
         if not self._repo:
             return {"total": 0, "by_status": {}, "by_type": {}, "pending_count": 0}
 
-        stats = await self._repo.get_stats()
-        stats["pending_count"] = stats.get("by_status", {}).get("pending", 0)
+        if self._stats_cache is not None and time.monotonic() - self._stats_cache[0] < self._STATS_TTL:
+            return dict(self._stats_cache[1])
+
+        return dict(await self._singleflight("stats", self._load_stats))
+
+    async def _load_stats(self) -> dict[str, Any]:
+        """Query aggregate stats from the DB and store them in the stats cache.
+
+        Re-queries if a fragment write lands mid-query, so pre-write counts are
+        never cached under the new version; after _MAX_STALE_REBUILDS retries the
+        latest counts are returned uncached.
+        """
+        if not self._repo:
+            return {"total": 0, "by_status": {}, "by_type": {}, "pending_count": 0}
+
+        for _ in range(self._MAX_STALE_REBUILDS + 1):
+            version = self._stats_version
+            stats: dict[str, Any] = await self._repo.get_stats()
+            stats["pending_count"] = stats.get("by_status", {}).get("pending", 0)
+            if self._stats_version == version:
+                self._stats_cache = (time.monotonic(), stats)
+                return stats
         return stats
 
     async def get_preview_block(self) -> str:
-        """Return a fresh (non-cached) personality block for UI preview.
+        """Return the personality block for UI preview.
+
+        Served from the same cache as get_personality_block(). Fragment writes that
+        touch approved fragments and personality settings updates invalidate it,
+        so a forced rebuild (and possible LLM compression) per preview is unnecessary.
 
         Returns:
             Formatted personality block string.
         """
-        return await self.get_personality_block(force_refresh=True)
+        return await self.get_personality_block()
 
     # ──────────────────────────────────────────────────────────────────────────
     # Compression